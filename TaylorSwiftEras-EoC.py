@@ -24,10 +24,9 @@ PIXMOB IR Code for Taylor Switch EOC Cycle
 Be sure to set your GPIO Pin in config file:
 'pipyir/config.py'.
 """
-import pipyir.config as cfg  # Import configuration settings
 import pipyir.ir  # Import the ir module
-from pipyir.effect_definitions import base_color_effects, tail_codes, special_effects
-import time
+from pipyir.effect_library import effects
+from pipyir.timeline import Timeline
 
 EFFECTS_TO_SHOW = [
     {
@@ -79,36 +78,9 @@ EFFECTS_TO_SHOW = [
 
 ir_sender = pipyir.ir.IRSender()
 
-def send_effect(main_effect, tail_code):
-    if main_effect in base_color_effects:
-        effect_bits = base_color_effects[main_effect]
-        if tail_code:
-            if tail_code in tail_codes:
-                effect_bits += tail_codes[tail_code]
-            else:
-                raise Exception("Invalid tail code name. See tail_codes in effect_definitions.py for options.")
-    elif main_effect in special_effects:
-        effect_bits = special_effects[main_effect]
-        if tail_code:
-            raise Exception("Tail code effects only supported on simple color effects found in base_color_effects of "
-                            "effect_definitions.py. Set tail_code to None or choose a main_effect from base_color_effects "
-                            "(instead of special_effects).")
-    else:
-        raise Exception("Invalid main_effect. See base_color_effects and special_effects in effect_definitions.py for "
-                        "options.")
-
-    # Send the effect_bits using ir_sender
-    ir_sender.send_bits_command(effect_bits)
-
-    # Wait for enough time for the Raspberry Pi to transmit this code
-    time.sleep(cfg.WAIT_BEFORE_SEND + 0.0008 * len(effect_bits))
-
-    if cfg.DEBUG:
-        print(f"Sent effect: {main_effect}, {'no tail effect' if not tail_code else 'tail: ' + tail_code}.")
-
-for effect_instance in EFFECTS_TO_SHOW:
-    send_effect(effect_instance.get("main_effect"), effect_instance.get("tail_code", None))
-    time.sleep(effect_instance["duration"])
+# Cue times are absolute, so transmit time does not add up into drift over the show
+timeline = Timeline.from_effects_to_show(EFFECTS_TO_SHOW, effects)
+timeline.play(ir_sender)
 
 # Clean up
 ir_sender.cleanup()
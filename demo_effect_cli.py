@@ -39,6 +39,7 @@ from pipyir.effect_definitions import (
     tail_codes,
     special_effects,
 )
+from pipyir.effect_library import compose, effects
 
 logging.basicConfig(
     level=logging.INFO,
@@ -82,15 +83,9 @@ def send_effect(
     # Declare ir_sender as global to access the global instance
     global ir_sender
 
-    effect_bits = []
-
     effect_code = effect_code.upper().strip()
 
-    if effect_code in base_color_effects:
-        effect_bits = base_color_effects[effect_code]
-    elif effect_code in special_effects:
-        effect_bits = special_effects[effect_code]
-    else:
+    if effect_code not in effects:
         LOG.warning(
             "Invalid effect '%s'. See base_color_effects and "
             "special_effects in effect_definitions.py for options.",
@@ -98,24 +93,29 @@ def send_effect(
         )
         return
 
-    # NOTE: Tail codes may not be compatible with special effects
     if tail_code is not None:
         tail_code = tail_code.upper().strip()
 
-        if tail_code in tail_codes:
-            effect_bits += tail_codes[tail_code]
-        else:
+        if tail_code not in tail_codes:
             LOG.warning(
                 "Invalid tail code '%s'. See tail_codes "
                 "in effect_definitions.py for options.",
                 tail_code,
             )
+            tail_code = None
+
+    # The composed effect is precompiled and shared, so the definitions are never modified
+    try:
+        effect = compose(effect_code, tail_code)
+    except ValueError as exc:
+        LOG.warning("%s", exc)
+        return
 
-    # Send the effect_bits using ir_sender
-    ir_sender.send_bits_command(effect_bits)
+    # Send the effect using ir_sender; this returns once it has been transmitted
+    ir_sender.send_effect(effect)
 
     # Small delay after each command
-    time.sleep(cfg.WAIT_BEFORE_SEND + 0.0008 * len(effect_bits))
+    time.sleep(cfg.WAIT_BEFORE_SEND)
 
     if cfg.DEBUG:
         LOG.debug(
@@ -27,9 +27,8 @@ Be sure to set your GPIO Pin in config file:
 """
 import pipyir.config as cfg  # Import configuration settings
 import pipyir.ir  # Import the ir module
-from pipyir.effect_definitions import base_color_effects, tail_codes, special_effects
+from pipyir.effect_library import compose
 import time
-import datetime
 
 # List of all effects you want to display, in order. Each entry has the effect name, optional tail code, and
 # duration to wait before sending next effect. Note that some effects are long, and the bracelets might not respond
@@ -88,46 +87,49 @@ EFFECTS_TO_SHOW = [
 # Initialize the IRSender
 ir_sender = pipyir.ir.IRSender()
 
+def get_effect(main_effect, tail_code):
+    """
+    Looks up the precompiled effect for a main effect and optional tail code.
+
+    :param main_effect: The main effect name (string)
+    :param tail_code: The tail code name (string or None)
+    """
+    try:
+        # The composed effect is precompiled and shared, so the definitions are never modified
+        return compose(main_effect, tail_code)
+    except KeyError:
+        raise Exception("Invalid main_effect or tail code. See base_color_effects, special_effects and tail_codes in "
+                        "effect_definitions.py for options.")
+    except ValueError:
+        raise Exception("Tail code effects only supported on simple color effects found in base_color_effects of "
+                        "effect_definitions.py. Set tail_code to None or choose a main_effect from base_color_effects "
+                        "(instead of special_effects).")
+
 def send_effect(main_effect, tail_code, sleep_after_send=False):
     """
     Sends a single effect via IR.
 
     :param main_effect: The main effect name (string)
     :param tail_code: The tail code name (string or None)
-    :param sleep_after_send: Whether to sleep after sending to allow for transmission time
+    :param sleep_after_send: Whether to leave a gap after sending before the next code
     """
-    if main_effect in base_color_effects:
-        effect_bits = base_color_effects[main_effect]
-        if tail_code:
-            if tail_code in tail_codes:
-                effect_bits += tail_codes[tail_code]
-            else:
-                raise Exception("Invalid tail code name. See tail_codes in effect_definitions.py for options.")
-    elif main_effect in special_effects:
-        effect_bits = special_effects[main_effect]
-        if tail_code:
-            raise Exception("Tail code effects only supported on simple color effects found in base_color_effects of "
-                            "effect_definitions.py. Set tail_code to None or choose a main_effect from base_color_effects "
-                            "(instead of special_effects).")
-    else:
-        raise Exception("Invalid main_effect. See base_color_effects and special_effects in effect_definitions.py for "
-                        "options.")
+    effect = get_effect(main_effect, tail_code)
 
-    # Send the effect_bits using ir_sender
-    ir_sender.send_bits_command(effect_bits)
+    # Send the effect using ir_sender; this returns once it has been transmitted
+    ir_sender.send_effect(effect)
 
     if sleep_after_send:
-        # Wait for enough time for the Raspberry Pi to transmit this code
-        time.sleep(cfg.WAIT_BEFORE_SEND + 0.0008 * len(effect_bits))
+        # Leave a gap before the next code
+        time.sleep(cfg.WAIT_BEFORE_SEND)
     if cfg.DEBUG:
         print(f"Sent effect: {main_effect}, {'no tail effect' if not tail_code else 'tail: ' + tail_code}.")
 
 for effect_instance in EFFECTS_TO_SHOW:
     if effect_instance.get("main_effect"):
         if effect_instance.get("hold_with_repeated_send", False):
-            start_time = datetime.datetime.now()
-            while (datetime.datetime.now() - start_time).total_seconds() <= effect_instance["duration"]:
-                send_effect(effect_instance["main_effect"], effect_instance.get("tail_code"), sleep_after_send=True)
+            # The code is uploaded once and pigpio repeats it for the whole duration
+            ir_sender.hold(get_effect(effect_instance["main_effect"], effect_instance.get("tail_code")),
+                           effect_instance["duration"])
         else:
             send_effect(effect_instance["main_effect"], effect_instance.get("tail_code"))
             time.sleep(effect_instance["duration"])
@@ -0,0 +1,109 @@
+"""
+This module provides the AsyncIRSender class, an asyncio facade over IRSender.
+Commands are put on a bounded transmit queue and sent by a single writer task, which owns the pigpio
+connection through a one-thread executor. Coroutines submitting commands never block the event loop,
+and wait for queue space when the transmitter falls behind.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pipyir.config as cfg  # Import configuration settings
+import pipyir.ir  # Import the ir module
+
+class AsyncIRSender:
+    def __init__(self, sender=None, max_queue=None):
+        """
+        :param sender: IRSender to transmit with (a new one is created if None)
+        :param max_queue: Maximum number of queued commands, defaults to TX_QUEUE_SIZE
+        """
+        self.sender = sender if sender is not None else pipyir.ir.IRSender()
+        self.max_queue = cfg.TX_QUEUE_SIZE if max_queue is None else max_queue
+        self._queue = None
+        self._task = None
+        self._executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def queue_depth(self):
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self):
+        """
+        Starts the writer task. Must be called from the event loop that will submit commands.
+        """
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(self.max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipyir-tx")
+        self._task = asyncio.get_running_loop().create_task(self._writer())
+
+    async def send(self, command, wait=True):
+        """
+        Queues a command for transmission, waiting for queue space if the queue is full.
+
+        :param command: CompiledEffect or list of bits (0s and 1s)
+        :param wait: Whether to wait until the command has been transmitted
+        :return: The Transmission if wait is True, otherwise a future resolving to it
+        """
+        if self._task is None:
+            await self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((command, future))
+        if wait:
+            return await future
+        return future
+
+    async def _writer(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            command, future = await self._queue.get()
+            try:
+                if command is None:
+                    return
+                if future.cancelled():
+                    continue
+                try:
+                    transmission = await loop.run_in_executor(self._executor, self._start, command)
+                    if transmission is not None:
+                        # Sleep through the airtime on the event loop, then let the executor finish up
+                        await asyncio.sleep(transmission.remaining())
+                        await loop.run_in_executor(self._executor, transmission.wait)
+                except Exception as exc:
+                    if not future.cancelled():
+                        future.set_exception(exc)
+                else:
+                    if not future.cancelled():
+                        future.set_result(transmission)
+            finally:
+                self._queue.task_done()
+
+    def _start(self, command):
+        # Runs on the executor thread that owns the pigpio connection
+        if hasattr(command, "run_lengths"):
+            return self.sender.send_effect(command, wait=False)
+        return self.sender.send_bits_command(command, wait=False)
+
+    async def close(self, cleanup=True):
+        """
+        Sends everything still queued, stops the writer task and optionally cleans up the IRSender.
+
+        :param cleanup: Whether to call IRSender.cleanup()
+        """
+        if self._task is not None:
+            await self._queue.put((None, None))
+            await self._task
+            self._task = None
+        if self._executor is not None:
+            if cleanup:
+                await asyncio.get_running_loop().run_in_executor(self._executor, self.sender.cleanup)
+            self._executor.shutdown()
+            self._executor = None
+        elif cleanup:
+            self.sender.cleanup()
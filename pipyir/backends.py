@@ -0,0 +1,504 @@
+"""
+This module provides the transmit backends used by IRSender.
+A backend offers the subset of the pigpio.pi wave API that IRSender uses (wave_add_generic, wave_create,
+wave_send_once, wave_chain, ...), so the sender code is the same whichever backend is in use.
+Backends also offer wave_add_packed, which takes pulses already in pigpio's wire format (see PULSE_STRUCT)
+so a prebuilt pulse buffer is uploaded without creating or repacking any per-pulse objects.
+
+- PigpioBackend talks to the pigpio daemon and drives the real IR LED.
+- PipelinedPigpioBackend also drives pigpiod, over its own socket client: commands whose result IRSender
+  does not need are written without waiting for the reply, and go out in one write with the next command
+  that does, so a send costs one round trip instead of one per command.
+- RecordingBackend keeps every wave and transmission in memory with timestamps, and emulates pigpio's
+  wave memory limits and transmit timing. It needs no hardware or pigpio install, which makes it
+  suitable for benchmarks, load tests and running show scripts on any machine.
+- FileBackend records like RecordingBackend and also writes one line per transmission to a file or pipe.
+
+The backend IRSender creates by default is selected with BACKEND in 'pipyir/config.py'.
+"""
+
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+
+import pipyir.config as cfg  # Import configuration settings
+
+try:
+    import pigpio
+except ImportError:  # Only the pigpio backend needs it
+    pigpio = None
+
+# GPIO mode for outputs, same value as pigpio.OUTPUT
+OUTPUT = 1
+
+# Error codes returned by wave_create and wave_chain, same values as pigpio's
+ERROR_TOO_MANY_PULSES = -36
+ERROR_BAD_WAVE_ID = -66
+ERROR_CHAIN_COUNTER = -115
+ERROR_NO_WAVEFORM_ID = -116
+ERROR_CHAIN_TOO_BIG = -119
+
+# pigpiod socket commands used by PipelinedPigpioBackend, same values as pigpio's _PI_CMD_*
+CMD_MODES = 0
+CMD_WVCLR = 27
+CMD_WVAG = 28
+CMD_WVBSY = 32
+CMD_WVHLT = 33
+CMD_WVSP = 35
+CMD_WVCRE = 49
+CMD_WVDEL = 50
+CMD_WVTX = 51
+CMD_WVTXR = 52
+CMD_WVNEW = 53
+CMD_WVCHA = 93
+
+# pigpiod command and reply header: command, p1, p2, p3 (the extension length, or the result in replies)
+COMMAND_STRUCT = struct.Struct("<IIII")
+REPLY_STRUCT = struct.Struct("<12xi")
+
+# Written commands whose reply PipelinedPigpioBackend leaves unread before reading them all
+MAX_UNREAD_REPLIES = 64
+
+# One pulse in pigpio's wire format, as sent to pigpiod by wave_add_generic: gpio_on, gpio_off, delay
+PULSE_STRUCT = struct.Struct("<III")
+
+# Limits of pigpio's default configuration
+DEFAULT_MAX_PULSES = 12000
+DEFAULT_MAX_WAVES = 250
+
+# Limits of a single wave_chain call in pigpio: command list bytes, and loops (one chain counter each)
+MAX_CHAIN_BYTES = 600
+MAX_CHAIN_LOOPS = 20
+
+def chain_loop_count(chain):
+    """
+    :param chain: wave_chain command list
+    :return: Number of loops in the chain, each of which takes one of pigpio's chain counters
+    """
+    loops = 0
+    i = 0
+    while i < len(chain):
+        if chain[i] != 255:
+            i += 1
+            continue
+        command = chain[i + 1]
+        if command == 0:  # Loop start
+            loops += 1
+        i += 4 if command in (1, 2) else 2
+    return loops
+
+class Pulse:
+    """
+    One wave step: GPIOs to switch on, GPIOs to switch off, then a delay (in microseconds).
+    Has the same attributes as pigpio.pulse, so lists of Pulses can be passed to pigpio directly.
+    """
+    __slots__ = ("gpio_on", "gpio_off", "delay")
+
+    def __init__(self, gpio_on, gpio_off, delay):
+        self.gpio_on = gpio_on
+        self.gpio_off = gpio_off
+        self.delay = delay
+
+    def __repr__(self):
+        return f"Pulse({self.gpio_on:#x}, {self.gpio_off:#x}, {self.delay})"
+
+class PigpioBackend:
+    """
+    Backend driving the GPIOs through the pigpio daemon. Every pigpio.pi method is available on it.
+    """
+    def __init__(self, host=None, port=None):
+        """
+        :param host: pigpio daemon host, defaults to pigpio's own default (localhost or $PIGPIO_ADDR)
+        :param port: pigpio daemon port, defaults to pigpio's own default (8888 or $PIGPIO_PORT)
+        """
+        if pigpio is None:
+            raise RuntimeError("The pigpio backend needs the pigpio module (python3-pigpio)")
+        kwargs = {}
+        if host is not None:
+            kwargs["host"] = host
+        if port is not None:
+            kwargs["port"] = port
+        self.pi = pigpio.pi(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.pi, name)
+
+    def wave_add_packed(self, data):
+        """
+        Adds pulses to the wave being built, like wave_add_generic, but from a buffer already in pigpio's
+        wire format, which is written to the pigpiod socket as is.
+
+        :param data: bytes-like holding PULSE_STRUCT records
+        :return: Number of pulses in the wave being built, or a negative pigpio error code
+        """
+        if not data:
+            return 0
+        return pigpio._u2i(pigpio._pigpio_command_ext(self.pi.sl, pigpio._PI_CMD_WVAG, 0, 0, len(data), [data]))
+
+class PipelinedPigpioBackend:
+    """
+    Backend talking to the pigpio daemon over its own socket, without the pigpio module.
+
+    pigpiod answers the commands of a socket in order, so commands do not have to wait for their reply before
+    the next one is written. Commands whose result IRSender ignores (wave_add_new, wave_add_packed,
+    wave_delete, ...) are queued and return 0 at once; a command whose result is needed (wave_create,
+    wave_tx_busy, ...) is written together with the queued ones and the replies are read afterwards.
+    Transmit commands are written immediately but their reply is not waited for, except wave_chain, which
+    pigpiod rejects when the chain exceeds its limits. So a send of a new wave costs one round trip
+    (wave_add_new, wave_add_packed and wave_create in one write), a send of a cached wave none, and deleting
+    the previous wave goes out with the next command instead of taking its own round trip between two
+    transmissions.
+
+    Errors of queued commands show up later: they are counted in deferred_errors, and the last one is kept
+    in last_deferred_error as (command, error code).
+    """
+    def __init__(self, host=None, port=None):
+        """
+        :param host: pigpio daemon host, defaults to $PIGPIO_ADDR or localhost
+        :param port: pigpio daemon port, defaults to $PIGPIO_PORT or 8888
+        """
+        if host is None:
+            host = os.environ.get("PIGPIO_ADDR") or "localhost"
+        if port is None:
+            port = int(os.environ.get("PIGPIO_PORT") or 8888)
+        self.sock = socket.create_connection((host, port))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self.sock.makefile("rb")
+        self._lock = threading.Lock()  # Hold.cancel() may stop a transmission from another thread
+        self._queued = bytearray()  # Commands not written yet
+        self._unread = []  # Commands written whose reply has not been read, oldest first
+        self.deferred_errors = 0
+        self.last_deferred_error = None
+        self.connected = True
+
+    def _read_replies(self, wanted=True):
+        """
+        Reads the replies of every written command.
+
+        :param wanted: Whether the last command's result is wanted by the caller, rather than deferred
+        :return: Result of the last command
+        """
+        replies = self._reader.read(REPLY_STRUCT.size * len(self._unread))
+        if len(replies) < REPLY_STRUCT.size * len(self._unread):
+            raise ConnectionError("pigpio daemon closed the connection")
+        result = 0
+        for i, command in enumerate(self._unread):
+            result = REPLY_STRUCT.unpack_from(replies, i * REPLY_STRUCT.size)[0]
+            if result < 0 and (i + 1 < len(self._unread) or not wanted):
+                self.deferred_errors += 1
+                self.last_deferred_error = (command, result)
+        self._unread.clear()
+        return result
+
+    def _command(self, command, p1=0, p2=0, extension=b"", reply=True, flush=True):
+        """
+        Queues a command, writing it (with every queued command) when flush or reply is set.
+
+        :param reply: Whether to wait for the command's result
+        :param flush: Whether to write the command now, for commands that start or stop a transmission
+        :return: The command's result if reply is set, 0 otherwise
+        """
+        with self._lock:
+            self._queued += COMMAND_STRUCT.pack(command, p1, p2, len(extension))
+            self._queued += extension
+            self._unread.append(command)
+            if reply or flush:
+                self.sock.sendall(self._queued)
+                self._queued.clear()
+            if reply:
+                return self._read_replies()
+            if len(self._unread) >= MAX_UNREAD_REPLIES:
+                # Keep the unread replies from filling the socket buffers; the queued commands are written
+                # first, since pigpiod only replies to commands it has received
+                if self._queued:
+                    self.sock.sendall(self._queued)
+                    self._queued.clear()
+                self._read_replies(wanted=False)
+            return 0
+
+    def set_mode(self, gpio, mode):
+        return self._command(CMD_MODES, gpio, mode)
+
+    def wave_add_new(self):
+        return self._command(CMD_WVNEW, reply=False, flush=False)
+
+    def wave_add_generic(self, pulses):
+        return self.wave_add_packed(b"".join(PULSE_STRUCT.pack(p.gpio_on, p.gpio_off, p.delay) for p in pulses))
+
+    def wave_add_packed(self, data):
+        """
+        Queues pulses already in pigpio's wire format. Returns 0 rather than the pulse count, which is only
+        known once the reply is read.
+        """
+        if not data:
+            return 0
+        return self._command(CMD_WVAG, extension=bytes(data), reply=False, flush=False)
+
+    def wave_create(self):
+        return self._command(CMD_WVCRE)
+
+    def wave_delete(self, wid):
+        return self._command(CMD_WVDEL, wid, reply=False, flush=False)
+
+    def wave_send_once(self, wid):
+        return self._command(CMD_WVTX, wid, reply=False)
+
+    def wave_send_repeat(self, wid):
+        return self._command(CMD_WVTXR, wid, reply=False)
+
+    def wave_chain(self, data):
+        return self._command(CMD_WVCHA, extension=bytes(data))
+
+    def wave_tx_busy(self):
+        return self._command(CMD_WVBSY)
+
+    def wave_tx_stop(self):
+        return self._command(CMD_WVHLT, reply=False)
+
+    def wave_clear(self):
+        return self._command(CMD_WVCLR)
+
+    def wave_get_max_pulses(self):
+        return self._command(CMD_WVSP, 2)
+
+    def sync(self):
+        """
+        Writes the queued commands and reads every outstanding reply, e.g. to check deferred_errors.
+        """
+        with self._lock:
+            if self._queued:
+                self.sock.sendall(self._queued)
+                self._queued.clear()
+            if self._unread:
+                self._read_replies(wanted=False)
+
+    def stop(self):
+        if not self.connected:
+            return
+        try:
+            self.sync()
+        except OSError:
+            pass
+        self.connected = False
+        self._reader.close()
+        self.sock.close()
+
+class RecordingEvent:
+    __slots__ = ("timestamp", "kind", "wid", "chain", "duration_us")
+
+    def __init__(self, timestamp, kind, wid=None, chain=None, duration_us=0):
+        """
+        :param timestamp: time.monotonic() at which the backend was called
+        :param kind: "once", "repeat", "chain" or "stop"
+        :param wid: Wave ID for "once" and "repeat"
+        :param chain: wave_chain bytes for "chain"
+        :param duration_us: Airtime of the transmission (one repeat for "repeat")
+        """
+        self.timestamp = timestamp
+        self.kind = kind
+        self.wid = wid
+        self.chain = chain
+        self.duration_us = duration_us
+
+    def __repr__(self):
+        target = self.wid if self.chain is None else f"{len(self.chain)} byte chain"
+        return f"RecordingEvent({self.timestamp:.6f}, {self.kind!r}, {target}, {self.duration_us}us)"
+
+class RecordingBackend:
+    """
+    In-memory backend that records waves and transmissions instead of driving a GPIO.
+    """
+    connected = True
+
+    def __init__(self, max_pulses=DEFAULT_MAX_PULSES, max_waves=DEFAULT_MAX_WAVES):
+        """
+        :param max_pulses: Size of the emulated pigpio pulse pool shared by all waves
+        :param max_waves: Number of emulated wave IDs
+        """
+        self.max_pulses = max_pulses
+        self.max_waves = max_waves
+        self.modes = {}  # GPIO -> mode
+        self.waves = {}  # wave ID -> list of (gpio_on, gpio_off, delay)
+        self.events = []  # RecordingEvent, one per transmission
+        self.pulses_added = 0  # Total pulses ever uploaded
+        self.waves_created = 0
+        self._building = []
+        self._tx_end = 0.0
+
+    def _record(self, event):
+        self.events.append(event)
+
+    def set_mode(self, gpio, mode):
+        self.modes[gpio] = mode
+        return 0
+
+    def wave_add_new(self):
+        self._building = []
+        return 0
+
+    def wave_add_generic(self, pulses):
+        self._building.extend((p.gpio_on, p.gpio_off, p.delay) for p in pulses)
+        self.pulses_added += len(pulses)
+        return len(self._building)
+
+    def wave_add_packed(self, data):
+        pulses = list(PULSE_STRUCT.iter_unpack(data))
+        self._building.extend(pulses)
+        self.pulses_added += len(pulses)
+        return len(self._building)
+
+    def wave_create(self):
+        if sum(len(wave) for wave in self.waves.values()) + len(self._building) > self.max_pulses:
+            return ERROR_TOO_MANY_PULSES
+        wid = next((wid for wid in range(self.max_waves) if wid not in self.waves), None)
+        if wid is None:
+            return ERROR_NO_WAVEFORM_ID
+        self.waves[wid] = self._building
+        self._building = []
+        self.waves_created += 1
+        return wid
+
+    def wave_delete(self, wid):
+        if self.waves.pop(wid, None) is None:
+            return ERROR_BAD_WAVE_ID
+        return 0
+
+    def wave_duration_us(self, wid):
+        return sum(delay for _, _, delay in self.waves[wid])
+
+    def chain_duration_us(self, chain):
+        """
+        Computes the airtime of a wave_chain command list.
+
+        :return: Airtime (in microseconds), or None if the chain loops forever
+        """
+        total = 0
+        loop_start = None
+        i = 0
+        while i < len(chain):
+            byte = chain[i]
+            if byte != 255:
+                total += self.wave_duration_us(byte)
+                i += 1
+                continue
+            command = chain[i + 1]
+            if command == 0:  # Loop start
+                loop_start = total
+                i += 2
+            elif command == 1:  # Loop end, repeat the loop body x + 256 * y times in total
+                count = chain[i + 2] + 256 * chain[i + 3]
+                total = loop_start + (total - loop_start) * count
+                i += 4
+            elif command == 2:  # Delay x + 256 * y microseconds
+                total += chain[i + 2] + 256 * chain[i + 3]
+                i += 4
+            elif command == 3:  # Loop forever
+                return None
+            else:
+                raise ValueError(f"Unknown wave chain command 255 {command}")
+        return total
+
+    def _start(self, kind, duration_us, wid=None, chain=None):
+        now = time.monotonic()
+        self._tx_end = float("inf") if duration_us is None else now + duration_us / 1e6
+        self._record(RecordingEvent(now, kind, wid, chain, duration_us))
+        return 0
+
+    def wave_send_once(self, wid):
+        if wid not in self.waves:
+            return ERROR_BAD_WAVE_ID
+        return self._start("once", self.wave_duration_us(wid), wid=wid)
+
+    def wave_send_repeat(self, wid):
+        if wid not in self.waves:
+            return ERROR_BAD_WAVE_ID
+        self._start("repeat", self.wave_duration_us(wid), wid=wid)
+        self._tx_end = float("inf")
+        return 0
+
+    def wave_chain(self, data):
+        chain = bytes(data)
+        if len(chain) > MAX_CHAIN_BYTES:
+            return ERROR_CHAIN_TOO_BIG
+        if chain_loop_count(chain) > MAX_CHAIN_LOOPS:
+            return ERROR_CHAIN_COUNTER
+        return self._start("chain", self.chain_duration_us(chain), chain=chain)
+
+    def wave_tx_busy(self):
+        return 1 if time.monotonic() < self._tx_end else 0
+
+    def wave_tx_stop(self):
+        self._tx_end = 0.0
+        self._record(RecordingEvent(time.monotonic(), "stop"))
+        return 0
+
+    def wave_clear(self):
+        self.waves.clear()
+        return 0
+
+    def wave_get_max_pulses(self):
+        return self.max_pulses
+
+    def stop(self):
+        self.connected = False
+
+class FileBackend(RecordingBackend):
+    """
+    Recording backend that also writes one line per transmission to a text stream, e.g. a file or a named
+    pipe read by a visualiser. Each line holds the timestamp, the kind of transmission, its airtime and the
+    pulses as gpio_on:gpio_off:delay triples (or the chain bytes in hex).
+    """
+    def __init__(self, stream=None, keep_events=False, **kwargs):
+        """
+        :param stream: Writable text stream, or a path to open, defaults to BACKEND_OUTPUT
+        :param keep_events: Whether to also keep the events in memory
+        """
+        super().__init__(**kwargs)
+        if stream is None:
+            stream = cfg.BACKEND_OUTPUT
+        self._owns_stream = isinstance(stream, str) and stream != "-"
+        if stream == "-":
+            stream = sys.stdout
+        elif isinstance(stream, str):
+            stream = open(stream, "a", buffering=1)
+        self.stream = stream
+        self.keep_events = keep_events
+
+    def _record(self, event):
+        if self.keep_events:
+            self.events.append(event)
+        if event.kind == "chain":
+            detail = event.chain.hex()
+        elif event.wid is not None:
+            detail = " ".join(f"{on:x}:{off:x}:{delay}" for on, off, delay in self.waves[event.wid])
+        else:
+            detail = ""
+        self.stream.write(f"{event.timestamp:.6f} {event.kind} {event.duration_us} {detail}\n")
+
+    def stop(self):
+        super().stop()
+        self.stream.flush()
+        if self._owns_stream:
+            self.stream.close()
+
+def create_backend(name=None):
+    """
+    Creates a backend by name.
+
+    :param name: "pigpio", "pipelined", "recording" or "file", defaults to BACKEND
+    :return: The backend
+    """
+    if name is None:
+        name = cfg.BACKEND
+    if name == "pigpio":
+        return PigpioBackend()
+    if name == "pipelined":
+        return PipelinedPigpioBackend()
+    if name == "recording":
+        return RecordingBackend()
+    if name == "file":
+        return FileBackend()
+    raise ValueError(f"Unknown backend: {name}")
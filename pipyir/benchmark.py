@@ -0,0 +1,324 @@
+"""
+This module is a benchmark suite for the encode and transmit hot paths of pipyir.
+It runs against the in-memory RecordingBackend, so no Raspberry Pi or pigpio daemon is needed.
+
+Measured:
+- per effect in 'pipyir/effect_definitions.py': bits to run lengths, run lengths to pulses, to packed pulses
+  and to a wave chain (µs/op), pulses per wave, chain bytes and allocations while encoding packed pulses
+- all effects and tail combinations encoded at once, one by one and with the NumPy encoder (if installed)
+- the carrier frequency and duty cycle actually produced by the pulse encoder
+- per send: IRSender overhead on the calling thread, cold (encoding, upload and wave creation) and warm
+- sequences: commands per second for one-by-one and batch sends, and cue lateness (jitter) of a Timeline
+
+Results are printed and can be saved as JSON; a saved file can be compared against a later run:
+    python -m pipyir.benchmark --output before.json
+    python -m pipyir.benchmark --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import pipyir.config as cfg  # Import configuration settings
+from pipyir.backends import RecordingBackend
+from pipyir.effect_definitions import base_color_effects, special_effects, tail_codes
+from pipyir.effect_library import effects
+from pipyir.ir import (IRSender, bits_to_run_lengths_pulses, carrier_edge_us, carrier_timing, chain_block_cycles,
+                       run_lengths_to_chain, run_lengths_to_packed, run_lengths_to_pulses)
+from pipyir.timeline import Cue, Timeline
+from pipyir.vectorized import HAVE_NUMPY, encode_packed
+
+# Relative slowdown of a summary metric that --compare reports as a regression
+REGRESSION_THRESHOLD = 0.10
+
+def time_per_op_us(func, repeat):
+    """
+    Times a function call.
+
+    :param func: Function taking no arguments
+    :param repeat: Number of calls
+    :return: Median time per call (in microseconds)
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        func()
+        samples.append(time.perf_counter_ns() - start)
+    return statistics.median(samples) / 1e3
+
+def count_allocations(func):
+    """
+    Counts the memory blocks allocated by a function call and still alive afterwards (e.g. pulse objects).
+
+    :param func: Function taking no arguments
+    :return: Tuple of (allocated blocks, peak traced bytes)
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    del result
+    return blocks, peak
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def bench_encode(repeat):
+    """
+    Benchmarks encoding every effect definition.
+
+    :return: List of per effect result dicts
+    """
+    gpio_mask = 1 << cfg.IR_GPIO
+    unit = cfg.PULSE_LENGTH
+    carrier_freq = cfg.CARRIER_FREQUENCY
+    # Chain encoding only needs wave IDs, so placeholder ones stand in for the carrier waves
+    block_us = carrier_edge_us(2 * chain_block_cycles(carrier_freq), carrier_freq)
+    results = []
+    for category, definitions in (("base_color", base_color_effects), ("special", special_effects),
+                                  ("tail", tail_codes)):
+        for name, effect in definitions.items():
+            bit_list = list(effect)
+            run_lengths = bits_to_run_lengths_pulses(bit_list)
+            pulses = run_lengths_to_pulses(run_lengths, gpio_mask, unit, carrier_freq)
+            blocks, peak = count_allocations(lambda: run_lengths_to_packed(run_lengths, gpio_mask, unit,
+                                                                           carrier_freq))
+            results.append({
+                "name": name,
+                "category": category,
+                "bits": len(bit_list),
+                "runs": len(run_lengths),
+                "run_lengths_us": time_per_op_us(lambda: bits_to_run_lengths_pulses(bit_list), repeat),
+                "pulses_us": time_per_op_us(
+                    lambda: run_lengths_to_pulses(run_lengths, gpio_mask, unit, carrier_freq), repeat),
+                "packed_us": time_per_op_us(
+                    lambda: run_lengths_to_packed(run_lengths, gpio_mask, unit, carrier_freq), repeat),
+                "chain_us": time_per_op_us(
+                    lambda: run_lengths_to_chain(run_lengths, 0, block_us, lambda duration_us: 1, unit), repeat),
+                "pulses_per_wave": len(pulses),
+                "chain_bytes": len(run_lengths_to_chain(run_lengths, 0, block_us, lambda duration_us: 1, unit)),
+                "alloc_blocks": blocks,
+                "alloc_peak_bytes": peak,
+            })
+    return results
+
+def bench_batch_encode(repeat):
+    """
+    Benchmarks encoding the whole effect library, as done when a show is loaded.
+
+    :return: Dict of results
+    """
+    gpio_mask = 1 << cfg.IR_GPIO
+    run_lengths_list = [effect.run_lengths for effect in effects.values()]
+    repeat = max(1, repeat // 5)
+    results = {
+        "effects": len(run_lengths_list),
+        "python_ms": time_per_op_us(lambda: [run_lengths_to_pulses(run_lengths, gpio_mask, cfg.PULSE_LENGTH,
+                                                                   cfg.CARRIER_FREQUENCY)
+                                             for run_lengths in run_lengths_list], repeat) / 1e3,
+        "numpy_ms": None,
+    }
+    if HAVE_NUMPY:
+        results["numpy_ms"] = time_per_op_us(lambda: encode_packed(run_lengths_list, gpio_mask, cfg.PULSE_LENGTH,
+                                                                   cfg.CARRIER_FREQUENCY), repeat) / 1e3
+    return results
+
+def bench_send(sample, repeat):
+    """
+    Benchmarks the time IRSender spends on the calling thread per send, excluding airtime.
+
+    :param sample: List of CompiledEffects to send
+    :return: Dict of results
+    """
+    results = {}
+    # Cold sends encode, upload and create every wave, so both the wave cache and the pulse data cache are off
+    for label, cache_size, pulse_data_cache_size in (("cold", 0, 0),
+                                                     ("warm", cfg.WAVE_CACHE_SIZE, cfg.PULSE_DATA_CACHE_SIZE)):
+        saved = cfg.WAVE_CACHE_SIZE, cfg.PULSE_DATA_CACHE_SIZE
+        cfg.WAVE_CACHE_SIZE, cfg.PULSE_DATA_CACHE_SIZE = cache_size, pulse_data_cache_size
+        try:
+            sender = IRSender(RecordingBackend())
+            samples = []
+            for _ in range(repeat):
+                for effect in sample:
+                    if label == "warm":
+                        sender.preload(effect.run_lengths)
+                    start = time.perf_counter_ns()
+                    transmission = sender.send_effect(effect, wait=False)
+                    samples.append(time.perf_counter_ns() - start)
+                    transmission.wait()
+            sender.cleanup()
+        finally:
+            cfg.WAVE_CACHE_SIZE, cfg.PULSE_DATA_CACHE_SIZE = saved
+        results[label] = {
+            "mean_us": statistics.mean(samples) / 1e3,
+            "p50_us": percentile(samples, 0.5) / 1e3,
+            "p99_us": percentile(samples, 0.99) / 1e3,
+        }
+    return results
+
+def bench_sequence(sample):
+    """
+    Benchmarks end-to-end sends of a sequence, including airtime.
+
+    :param sample: List of CompiledEffects to send
+    :return: Dict of results
+    """
+    airtime = sum(sum(effect.run_lengths) for effect in sample) * cfg.PULSE_LENGTH / 1e6
+    results = {"airtime_s": airtime}
+    for label, batch in (("single", False), ("batch", True)):
+        sender = IRSender(RecordingBackend())
+        start = time.perf_counter()
+        sender.send_multiple_commands(sample, batch=batch, gap_us=0)
+        elapsed = time.perf_counter() - start
+        sender.cleanup()
+        results[label] = {
+            "commands_per_s": len(sample) / elapsed,
+            "airtime_utilisation": airtime / elapsed,
+        }
+    return results
+
+def bench_jitter(sample, cue_interval):
+    """
+    Plays the sample as a Timeline and measures cue lateness.
+
+    :param sample: List of CompiledEffects to play
+    :param cue_interval: Seconds between cues
+    :return: Dict of results
+    """
+    cues = [Cue(i * cue_interval, effect) for i, effect in enumerate(sample)]
+    sender = IRSender(RecordingBackend())
+    results = Timeline(cues).play(sender)
+    sender.cleanup()
+    lateness = [abs(result.lateness) * 1e6 for result in results]
+    return {
+        "cues": len(lateness),
+        "mean_us": statistics.mean(lateness),
+        "p99_us": percentile(lateness, 0.99),
+        "max_us": max(lateness),
+    }
+
+def summarise(report):
+    """
+    Picks the headline metrics of a report, all of them "lower is better".
+    """
+    encode = report["encode"]
+    summary = {
+        "run_lengths_us_mean": statistics.mean(e["run_lengths_us"] for e in encode),
+        "pulses_us_mean": statistics.mean(e["pulses_us"] for e in encode),
+        "packed_us_mean": statistics.mean(e["packed_us"] for e in encode),
+        "chain_us_mean": statistics.mean(e["chain_us"] for e in encode),
+        "pulses_per_wave_max": max(e["pulses_per_wave"] for e in encode),
+        "alloc_blocks_mean": statistics.mean(e["alloc_blocks"] for e in encode),
+        "send_cold_p50_us": report["send"]["cold"]["p50_us"],
+        "send_warm_p50_us": report["send"]["warm"]["p50_us"],
+        "jitter_p99_us": report["jitter"]["p99_us"],
+        "library_python_ms": report["batch_encode"]["python_ms"],
+    }
+    if report["batch_encode"]["numpy_ms"] is not None:
+        summary["library_numpy_ms"] = report["batch_encode"]["numpy_ms"]
+    return summary
+
+def run(repeat=10, sample_size=20, cue_interval=0.1):
+    """
+    Runs the whole suite.
+
+    :param repeat: Repetitions per timed measurement
+    :param sample_size: Number of effects used for the send, sequence and jitter benchmarks
+    :param cue_interval: Seconds between cues in the jitter benchmark
+    :return: Report dict
+    """
+    saved_debug = cfg.DEBUG
+    cfg.DEBUG = False
+    try:
+        sample = [effect for effect in effects.values() if effect.tail_code is None][:sample_size]
+        report = {
+            "meta": {
+                "timestamp": time.time(),
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "carrier_mode": cfg.CARRIER_MODE,
+                "pulse_length": cfg.PULSE_LENGTH,
+                "carrier_frequency": cfg.CARRIER_FREQUENCY,
+            },
+            "carrier": carrier_timing(
+                b"".join(run_lengths_to_packed(effect.run_lengths, 1 << cfg.IR_GPIO, cfg.PULSE_LENGTH,
+                                               cfg.CARRIER_FREQUENCY) for effect in sample),
+                1 << cfg.IR_GPIO, cfg.CARRIER_FREQUENCY),
+            "encode": bench_encode(repeat),
+            "batch_encode": bench_batch_encode(repeat),
+            "send": bench_send(sample, max(1, repeat // 5)),
+            "sequence": bench_sequence(sample),
+            "jitter": bench_jitter(sample, cue_interval),
+        }
+    finally:
+        cfg.DEBUG = saved_debug
+    report["summary"] = summarise(report)
+    return report
+
+def compare(report, baseline):
+    """
+    Compares the summary of a report against a baseline report.
+
+    :return: List of (metric, baseline value, new value, relative change, is regression)
+    """
+    rows = []
+    for metric, value in report["summary"].items():
+        old = baseline.get("summary", {}).get(metric)
+        if old is None:
+            continue
+        change = (value - old) / old if old else 0.0
+        rows.append((metric, old, value, change, change > REGRESSION_THRESHOLD))
+    return rows
+
+def print_report(report):
+    print(f"pipyir benchmark, {report['meta']['platform']}, Python {report['meta']['python']}")
+    carrier = report["carrier"]
+    print(f"carrier {carrier['frequency']:.1f} Hz (nominal {report['meta']['carrier_frequency']} Hz), "
+          f"duty cycle {carrier['duty_cycle'] * 100:.1f}%")
+    print(f"{'metric':24} {'value':>12}")
+    for metric, value in report["summary"].items():
+        print(f"{metric:24} {value:12.2f}")
+    for label, result in report["sequence"].items():
+        if isinstance(result, dict):
+            print(f"sequence {label:15} {result['commands_per_s']:12.2f} commands/s, "
+                  f"{result['airtime_utilisation'] * 100:.1f}% airtime")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pipyir encode and transmit paths.")
+    parser.add_argument("--repeat", type=int, default=10, help="Repetitions per timed measurement.")
+    parser.add_argument("--sample", type=int, default=20, help="Number of effects used for send benchmarks.")
+    parser.add_argument("--output", help="Save the results as JSON to this file.")
+    parser.add_argument("--compare", help="Compare against results saved earlier with --output.")
+    args = parser.parse_args()
+
+    report = run(args.repeat, args.sample)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = 0
+        for metric, old, new, change, regression in compare(report, baseline):
+            print(f"{metric:24} {old:12.2f} -> {new:12.2f} ({change:+.1%}){'  REGRESSION' if regression else ''}")
+            regressions += regression
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+This module provides a binary effect bundle format for large collections of captured codes, and the EffectBundle
+loader, which memory-maps a bundle and only decodes the entries that are actually used.
+
+Bundle layout (all integers little-endian):
+    header:  magic "PIRB", version (u16), flags (u16, unused), entry count (u32)
+    index:   one fixed size record per entry, sorted by name and then category:
+             name offset (u32), name length (u16), category (u8), bracelet generation (u8),
+             flags (u8, bit 0 = accepts tail codes), padding (u8), bit count (u16), run count (u16),
+             data offset (u32)
+    data:    per entry, the bits packed big-endian into (bit count + 7) // 8 bytes, followed by one u8 per run length
+    names:   UTF-8 names referenced by the index
+
+Build a bundle from the shipped definitions with:
+    python -m pipyir.bundle build effects.pirb
+"""
+
+import argparse
+import mmap
+import struct
+
+from pipyir.effect import Effect
+
+MAGIC = b"PIRB"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHI")
+ENTRY = struct.Struct("<IHBBBxHHI")
+
+# Categories, in lookup precedence order (a base color effect wins over a special effect of the same name)
+CATEGORY_BASE_COLOR = 0
+CATEGORY_SPECIAL = 1
+CATEGORY_TAIL = 2
+CATEGORY_NAMES = ("base_color", "special", "tail")
+
+FLAG_ACCEPTS_TAIL = 0x01
+
+# Bracelet generation used when it is not known
+GENERATION_UNKNOWN = 0
+
+class BundleEntry:
+    """
+    A decoded bundle entry.
+    """
+    __slots__ = ("name", "category", "generation", "accepts_tail", "effect", "run_lengths")
+
+    def __init__(self, name, category, generation, accepts_tail, effect, run_lengths):
+        self.name = name
+        self.category = category
+        self.generation = generation
+        self.accepts_tail = accepts_tail
+        self.effect = effect
+        self.run_lengths = run_lengths
+
+    def __repr__(self):
+        return f"BundleEntry({self.name!r}, {CATEGORY_NAMES[self.category]}, {self.effect!r})"
+
+def write_bundle(path, base_color_effects, special_effects, tail_codes, generation=GENERATION_UNKNOWN):
+    """
+    Writes effect definition dicts (as found in 'pipyir/effect_definitions.py') to a bundle file.
+
+    :param path: Output file path
+    :param base_color_effects: Dict of base color effect names to bits
+    :param special_effects: Dict of special effect names to bits
+    :param tail_codes: Dict of tail code names to bits
+    :param generation: Bracelet generation to record for every entry
+    :return: Number of entries written
+    """
+    records = []
+    for category, definitions in ((CATEGORY_BASE_COLOR, base_color_effects),
+                                  (CATEGORY_SPECIAL, special_effects),
+                                  (CATEGORY_TAIL, tail_codes)):
+        for name, bits in definitions.items():
+            records.append((name.encode("utf-8"), category, Effect.from_bits(bits)))
+    records.sort(key=lambda record: (record[0], record[1]))
+
+    data = bytearray()
+    names = bytearray()
+    layout = []  # (name offset, data offset, run count), offsets relative to their blocks
+    for name, category, effect in records:
+        run_lengths = effect.to_run_lengths()
+        if any(run > 0xFF for run in run_lengths):
+            raise ValueError(f"Run longer than 255 bits in {name.decode()}")
+        layout.append((len(names), len(data), len(run_lengths)))
+        data += effect.bits.to_bytes((effect.length + 7) // 8, "big")
+        data += bytes(run_lengths)
+        names += name
+
+    data_start = HEADER.size + ENTRY.size * len(records)
+    names_start = data_start + len(data)
+    index = bytearray()
+    for (name, category, effect), (name_offset, data_offset, run_count) in zip(records, layout):
+        flags = FLAG_ACCEPTS_TAIL if category == CATEGORY_BASE_COLOR else 0
+        index += ENTRY.pack(names_start + name_offset, len(name), category, generation, flags,
+                            effect.length, run_count, data_start + data_offset)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(records)))
+        f.write(index)
+        f.write(data)
+        f.write(names)
+    return len(records)
+
+class EffectBundle:
+    """
+    Read-only view of a bundle file. The file is memory-mapped; entries are decoded on first use and cached.
+    """
+    def __init__(self, path):
+        """
+        :param path: Bundle file path
+        """
+        self._map = None
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not an effect bundle") from None
+        magic, version, _, self._count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an effect bundle")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported effect bundle version {version}")
+        self._decoded = {}  # entry index -> BundleEntry
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, name):
+        return self._find(name) is not None
+
+    def _record(self, i):
+        return ENTRY.unpack_from(self._map, HEADER.size + i * ENTRY.size)
+
+    def _name(self, i):
+        name_offset, name_len = self._record(i)[:2]
+        return self._map[name_offset:name_offset + name_len]
+
+    def _find(self, name, category=None):
+        """
+        Binary searches the sorted index for an entry.
+
+        :return: Entry index, or None if not found
+        """
+        key = name.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._name(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        # lo is the first entry with this name, which is also the one with the lowest category
+        while lo < self._count and self._name(lo) == key:
+            if category is None or self._record(lo)[2] == category:
+                return lo
+            lo += 1
+        return None
+
+    def _decode(self, i):
+        entry = self._decoded.get(i)
+        if entry is None:
+            name_offset, name_len, category, generation, flags, bit_count, run_count, data_offset = self._record(i)
+            bits_end = data_offset + (bit_count + 7) // 8
+            entry = BundleEntry(
+                self._map[name_offset:name_offset + name_len].decode("utf-8"),
+                category,
+                generation,
+                bool(flags & FLAG_ACCEPTS_TAIL),
+                Effect(int.from_bytes(self._map[data_offset:bits_end], "big"), bit_count),
+                tuple(self._map[bits_end:bits_end + run_count]),
+            )
+            self._decoded[i] = entry
+        return entry
+
+    def get(self, name, category=None):
+        """
+        Looks up an entry by name.
+
+        :param name: Effect or tail code name (string)
+        :param category: Category to restrict the lookup to (base color effects win when None)
+        :return: BundleEntry
+        :raises KeyError: If there is no such entry
+        """
+        i = self._find(name, category)
+        if i is None:
+            raise KeyError(f"Unknown effect: {name}")
+        return self._decode(i)
+
+    def entries(self):
+        """
+        Decodes and yields every entry, in index order.
+        """
+        for i in range(self._count):
+            yield self._decode(i)
+
+    def definitions(self):
+        """
+        Decodes the whole bundle into dicts shaped like those in 'pipyir/effect_definitions.py',
+        e.g. to build an EffectLibrary from it.
+
+        :return: Tuple of (base_color_effects, special_effects, tail_codes)
+        """
+        dicts = ({}, {}, {})
+        for entry in self.entries():
+            dicts[entry.category][entry.name] = entry.effect
+        return dicts
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+def main():
+    """
+    Command line converter: builds a bundle from the shipped definitions, or lists a bundle's contents.
+    """
+    parser = argparse.ArgumentParser(description="Build or inspect pipyir effect bundles.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="Convert pipyir/effect_definitions.py into a bundle.")
+    build.add_argument("path")
+    build.add_argument("--generation", type=int, default=GENERATION_UNKNOWN,
+                       help="Bracelet generation to record for every entry.")
+    listing = subparsers.add_parser("list", help="List the entries of a bundle.")
+    listing.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        from pipyir.effect_definitions import base_color_effects, special_effects, tail_codes
+        count = write_bundle(args.path, base_color_effects, special_effects, tail_codes, args.generation)
+        print(f"Wrote {count} entries to {args.path}")
+    else:
+        with EffectBundle(args.path) as bundle:
+            for entry in bundle.entries():
+                print(f"{entry.name:24} {CATEGORY_NAMES[entry.category]:10} gen {entry.generation} "
+                      f"{entry.effect.to_string()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+"""
+This module plays one show on several transmitter Pis at once.
+
+Every transmitter Pi runs an agent, which plays shows through its own IRSender:
+    python -m pipyir.cluster agent
+The coordinator pushes the compiled show (cue times and the effects' run lengths) to every agent, measures each
+agent's clock offset from ping round trips, and tells them all when to start. Each agent plays the show with a
+Timeline on its own clock shifted by its offset, so the cues fire at the same instant on every Pi. The offsets
+are measured again every CLUSTER_SYNC_INTERVAL seconds during the show to follow clock drift.
+
+A show file is a JSON list shaped like EFFECTS_TO_SHOW in the demo scripts:
+    python -m pipyir.cluster coordinator show.json --agent 192.168.1.11 --agent 192.168.1.12
+To try a show with several agents on one machine, using the recording backend:
+    python -m pipyir.cluster local show.json --agents 3
+
+Messages are JSON objects, one per line, over TCP. Times are time.monotonic() values of the coordinator.
+"""
+
+import argparse
+import json
+import socket
+import threading
+import time
+
+import pipyir.config as cfg  # Import configuration settings
+from pipyir.backends import RecordingBackend, create_backend
+from pipyir.effect_library import CompiledEffect, effects
+from pipyir.ir import IRSender
+from pipyir.metrics import MetricsServer
+from pipyir.realtime import RealtimeMode
+from pipyir.timeline import Cue, Timeline
+
+class Connection:
+    """
+    JSON lines over a TCP socket. Messages can be sent from several threads.
+    """
+    def __init__(self, sock):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock = sock
+        self._reader = sock.makefile("r", encoding="utf-8")
+        self._send_lock = threading.Lock()
+
+    def send(self, message):
+        data = (json.dumps(message) + "\n").encode("utf-8")
+        with self._send_lock:
+            self.sock.sendall(data)
+
+    def receive(self):
+        """
+        :return: The next message (dict)
+        :raises ConnectionError: If the other side closed the connection
+        """
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed")
+        return json.loads(line)
+
+    def close(self):
+        self._reader.close()
+        self.sock.close()
+
+def timeline_to_message(timeline):
+    return {
+        "type": "load",
+        "compensate_airtime": timeline.compensate_airtime,
+        "cues": [{"time": cue.time, "label": cue.label,
+                  "effect": cue.effect.to_dict() if cue.effect is not None else None} for cue in timeline.cues],
+    }
+
+def timeline_from_message(message):
+    cues = [Cue(cue["time"], CompiledEffect.from_dict(cue["effect"]) if cue["effect"] is not None else None,
+                cue["label"]) for cue in message["cues"]]
+    return Timeline(cues, message["compensate_airtime"])
+
+class Agent:
+    """
+    Plays shows received from a coordinator through an IRSender. Serves one coordinator at a time.
+    """
+    def __init__(self, sender, host="0.0.0.0", port=None, realtime=None):
+        """
+        :param sender: IRSender to play shows with
+        :param host: Address to listen on
+        :param port: TCP port to listen on, defaults to CLUSTER_PORT (0 picks a free port)
+        :param realtime: RealtimeMode (see pipyir/realtime.py) shows are played in, if any
+        """
+        self.sender = sender
+        self.realtime = realtime
+        self.server = socket.create_server((host, cfg.CLUSTER_PORT if port is None else port))
+        self.port = self.server.getsockname()[1]
+        self.offset = 0.0  # This agent's clock minus the coordinator's clock (in seconds)
+        self.timeline = None
+        self._player = None
+        self._closed = False
+
+    def serve_forever(self):
+        """
+        Accepts coordinator connections until close() is called.
+        """
+        while not self._closed:
+            try:
+                sock, address = self.server.accept()
+            except OSError:
+                if self._closed:
+                    return
+                raise
+            if cfg.DEBUG:
+                print(f"Coordinator connected from {address[0]}")
+            connection = Connection(sock)
+            try:
+                self._serve(connection)
+            except (ConnectionError, OSError):
+                pass
+            finally:
+                connection.close()
+            if cfg.DEBUG:
+                print("Coordinator disconnected")
+
+    def _serve(self, connection):
+        while True:
+            message = connection.receive()
+            kind = message.get("type")
+            if kind == "ping":
+                connection.send({"type": "pong", "id": message["id"], "time": time.monotonic()})
+            elif kind == "clock":
+                self.offset = message["offset"]
+            elif kind == "load":
+                if self._playing():
+                    connection.send({"type": "error", "message": "A show is playing"})
+                    continue
+                self.timeline = timeline_from_message(message)
+                connection.send({"type": "loaded", "cues": len(self.timeline.cues)})
+            elif kind == "play":
+                if self.timeline is None or self._playing():
+                    connection.send({"type": "error", "message": "No show loaded" if self.timeline is None
+                                     else "A show is playing"})
+                    continue
+                self._player = threading.Thread(target=self._play, args=(connection, message["start"]),
+                                                daemon=True)
+                self._player.start()
+            else:
+                connection.send({"type": "error", "message": f"Unknown message type: {kind}"})
+
+    def _playing(self):
+        return self._player is not None and self._player.is_alive()
+
+    def _play(self, connection, start):
+        # start is on the coordinator's clock; the offset moves every cue onto this agent's clock
+        if self.realtime is None:
+            results = self.timeline.play(self.sender, start, clock_offset=lambda: self.offset)
+        else:
+            with self.realtime:
+                results = self.timeline.play(self.sender, start, clock_offset=lambda: self.offset)
+        offset = self.offset
+        try:
+            connection.send({"type": "done",
+                             "results": [[result.target - offset, result.actual - offset] for result in results]})
+        except OSError:
+            pass
+
+    def close(self):
+        self._closed = True
+        self.server.close()
+
+class Coordinator:
+    """
+    Pushes shows to agents, keeps their clocks in sync and starts them together.
+    """
+    def __init__(self, agents, timeout=5.0):
+        """
+        :param agents: List of agent addresses, as "host", "host:port" or (host, port)
+        :param timeout: Seconds to wait when connecting to an agent
+        """
+        self.names = []
+        self.connections = []
+        for agent in agents:
+            if isinstance(agent, str):
+                host, _, port = agent.partition(":")
+                agent = (host, int(port) if port else cfg.CLUSTER_PORT)
+            sock = socket.create_connection(agent, timeout)
+            sock.settimeout(None)
+            self.names.append(f"{agent[0]}:{agent[1]}")
+            self.connections.append(Connection(sock))
+        self.offsets = [0.0] * len(self.connections)
+        self.round_trips = [0.0] * len(self.connections)
+        self.results = []  # Per agent, list of (target, actual) per cue on the coordinator's clock
+        self._done = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _expect(self, i, kind):
+        """
+        Receives messages from agent i until one of the given type arrives, keeping any show results.
+        """
+        while True:
+            message = self.connections[i].receive()
+            if message["type"] == kind:
+                return message
+            if message["type"] == "done":
+                self._done[i] = message
+            elif message["type"] == "error":
+                raise RuntimeError(f"Agent {self.names[i]}: {message['message']}")
+
+    def sync(self, rounds=None):
+        """
+        Measures every agent's clock offset and sends it to the agent.
+        Each offset comes from the ping with the fastest round trip, assuming the reply took half of it.
+
+        :param rounds: Pings per agent, defaults to CLUSTER_SYNC_ROUNDS
+        """
+        if rounds is None:
+            rounds = cfg.CLUSTER_SYNC_ROUNDS
+        for i, connection in enumerate(self.connections):
+            best = None
+            for ping in range(rounds):
+                sent = time.monotonic()
+                connection.send({"type": "ping", "id": ping})
+                reply = self._expect(i, "pong")
+                received = time.monotonic()
+                if best is None or received - sent < best[0]:
+                    best = (received - sent, reply["time"] - (sent + received) / 2)
+            self.round_trips[i], self.offsets[i] = best
+            connection.send({"type": "clock", "offset": self.offsets[i]})
+
+    def load(self, timeline):
+        message = timeline_to_message(timeline)
+        for connection in self.connections:
+            connection.send(message)
+        for i in range(len(self.connections)):
+            self._expect(i, "loaded")
+
+    def play(self, timeline, lead=None):
+        """
+        Plays a timeline on every agent at once, blocking until all agents have finished.
+
+        :param timeline: Timeline to play
+        :param lead: Seconds between starting and show time 0 (plus the timeline's lead-in), defaults to CLUSTER_LEAD
+        :return: Per agent, list of (target, actual) send times per cue on the coordinator's clock
+        """
+        if lead is None:
+            lead = cfg.CLUSTER_LEAD
+        self._done = {}
+        self.load(timeline)
+        self.sync()
+        start = time.monotonic() + lead + timeline.lead_in
+        for connection in self.connections:
+            connection.send({"type": "play", "start": start})
+        if cfg.DEBUG:
+            offsets = ", ".join(f"{name} {offset * 1e3:+.3f} ms" for name, offset in zip(self.names, self.offsets))
+            print(f"Show starting in {start - time.monotonic():.3f} s, clock offsets: {offsets}")
+
+        end = start + timeline.duration
+        while time.monotonic() + cfg.CLUSTER_SYNC_INTERVAL < end:
+            time.sleep(cfg.CLUSTER_SYNC_INTERVAL)
+            self.sync()
+
+        self.results = []
+        for i in range(len(self.connections)):
+            done = self._done.pop(i, None) or self._expect(i, "done")
+            self.results.append([tuple(result) for result in done["results"]])
+        if cfg.DEBUG:
+            print(self.report())
+        return self.results
+
+    def report(self):
+        """
+        Summarises the last show: each agent's worst lateness and the worst spread of a cue between agents.
+
+        :return: Report text
+        """
+        if not self.results:
+            return "No show played."
+        lines = []
+        for name, results, round_trip in zip(self.names, self.results, self.round_trips):
+            worst = max((actual - target for target, actual in results), key=abs, default=0.0)
+            lines.append(f"{name}: {len(results)} cues, worst lateness {worst * 1e3:.3f} ms, "
+                         f"round trip {round_trip * 1e3:.3f} ms")
+        spreads = [max(actuals) - min(actuals)
+                   for actuals in zip(*([actual for _, actual in results] for results in self.results))]
+        lines.append(f"Worst spread between agents: {max(spreads, default=0.0) * 1e3:.3f} ms")
+        return "\n".join(lines)
+
+    def close(self):
+        for connection in self.connections:
+            connection.close()
+
+def load_show(path):
+    """
+    Loads a JSON show file (a list shaped like EFFECTS_TO_SHOW) as a Timeline.
+    """
+    with open(path) as f:
+        return Timeline.from_effects_to_show(json.load(f), effects)
+
+def run_local(timeline, agent_count):
+    """
+    Plays a timeline on several agents in this process, each with its own recording backend.
+
+    :return: The Coordinator, holding the results
+    """
+    agents = [Agent(IRSender(RecordingBackend()), "127.0.0.1", 0) for _ in range(agent_count)]
+    for agent in agents:
+        threading.Thread(target=agent.serve_forever, daemon=True).start()
+    try:
+        with Coordinator([("127.0.0.1", agent.port) for agent in agents]) as coordinator:
+            coordinator.play(timeline)
+        return coordinator
+    finally:
+        for agent in agents:
+            agent.close()
+            agent.sender.cleanup()
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a show on several pipyir transmitters at once.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    agent = subparsers.add_parser("agent", help="Play shows sent by a coordinator.")
+    agent.add_argument("--host", default="0.0.0.0")
+    agent.add_argument("--port", type=int, default=cfg.CLUSTER_PORT)
+    agent.add_argument("--backend", help="Transmit backend, defaults to BACKEND in config.py.")
+    agent.add_argument("--metrics-port", type=int, default=cfg.METRICS_PORT,
+                       help="Port of the Prometheus metrics endpoint (-1 disables it).")
+    agent.add_argument("--realtime", action="store_true",
+                       help="Play shows in real-time mode (see pipyir/realtime.py), needs root.")
+    coordinator = subparsers.add_parser("coordinator", help="Play a show file on agents.")
+    coordinator.add_argument("show", help="JSON show file.")
+    coordinator.add_argument("--agent", action="append", required=True, help="Agent address, host[:port].")
+    local = subparsers.add_parser("local", help="Play a show file on agents in this process.")
+    local.add_argument("show", help="JSON show file.")
+    local.add_argument("--agents", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == "agent":
+        ir_sender = IRSender(create_backend(args.backend))
+        agent = Agent(ir_sender, args.host, args.port, RealtimeMode() if args.realtime else None)
+        metrics = None
+        if args.metrics_port is not None and args.metrics_port >= 0:
+            metrics = MetricsServer(sender=ir_sender, port=args.metrics_port)
+            metrics.start()
+        print(f"Agent listening on port {agent.port}")
+        try:
+            agent.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if metrics is not None:
+                metrics.close()
+            agent.close()
+            ir_sender.cleanup()
+    elif args.command == "coordinator":
+        with Coordinator(args.agent) as coordinator:
+            coordinator.play(load_show(args.show))
+        if not cfg.DEBUG:
+            print(coordinator.report())
+    else:
+        coordinator = run_local(load_show(args.show), args.agents)
+        if not cfg.DEBUG:
+            print(coordinator.report())
+
+if __name__ == "__main__":
+    main()
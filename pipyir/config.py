@@ -5,6 +5,12 @@ Configuration settings for the pipyir module.
 # GPIO pin connected to the IR LED
 IR_GPIO = 17  # Adjust this to the GPIO pin you're using
 
+# GPIO pins of several IR emitter banks driven together, e.g. [17, 27, 22] (None or empty drives IR_GPIO only)
+IR_GPIOS = None
+
+# Named groups of the GPIOs above for IRSender.send_zoned, e.g. {"left": [17], "right": [27, 22]}
+IR_ZONES = {}
+
 # Time to wait after sending, before next action (in seconds)
 WAIT_BEFORE_SEND = 0.01
 
@@ -16,3 +22,90 @@ CARRIER_FREQUENCY = 38000  # 38kHz carrier frequency
 
 # Whether to print debug statements
 DEBUG = True
+
+# Whether to record send counters and stage latencies (see pipyir/instrument.py); off by default since it adds
+# about a microsecond per send, and turned on by the metrics endpoint
+INSTRUMENTATION = False
+
+# Number of recent send events kept by the instrumentation
+INSTRUMENTATION_EVENTS = 256
+
+# Whether the instrumentation also keeps those recent events (costs a timestamp and a tuple per send)
+INSTRUMENTATION_EVENT_LOG = False
+
+# StageProfiler flags a send stage as an outlier when it takes this many times its usual duration
+# (see pipyir/profiling.py)
+PROFILE_OUTLIER_FACTOR = 3.0
+
+# Minimum time (in microseconds) an outlier must take beyond its usual duration, so that jitter on short stages
+# is not flagged
+PROFILE_OUTLIER_MIN_US = 100
+
+# Maximum number of pigpio waves kept for reuse by repeated sends (0 disables the wave cache)
+WAVE_CACHE_SIZE = 32
+
+# Maximum total pulses held by cached waves (None uses pigpio's own pulse limit)
+WAVE_CACHE_MAX_PULSES = None
+
+# Maximum number of commands whose packed pulse data is kept in memory for fast re-upload (0 disables it)
+PULSE_DATA_CACHE_SIZE = 256
+
+# How the carrier is generated:
+# "pulses" builds every carrier cycle into the wave (two pulses per cycle),
+# "chain" repeats a carrier block wave with pigpio's wave_chain, so each command only sends the mark/space envelope
+CARRIER_MODE = "pulses"
+
+# After sleeping for a command's expected airtime, also poll pigpio until the transmitter reports idle
+TX_VERIFY_POLL = False
+
+# Maximum number of commands waiting in a transmit queue before submitters have to wait
+TX_QUEUE_SIZE = 16
+
+# Seconds before each timeline cue to stop sleeping and spin on the clock, for sub-millisecond cue timing
+TIMELINE_SPIN = 0.002
+
+# CPUs the transmitter thread is pinned to in real-time mode, ideally isolated ones, e.g. [3]
+# (None leaves the affinity as is, see pipyir/realtime.py)
+REALTIME_CPUS = None
+
+# SCHED_FIFO priority of the transmitter thread in real-time mode (1 to 99, 0 keeps the normal policy)
+REALTIME_PRIORITY = 50
+
+# Whether real-time mode locks the process memory with mlockall
+REALTIME_LOCK_MEMORY = True
+
+# Transmit backend used by IRSender: "pigpio" drives the IR LED, "pipelined" drives it through pipyir's own
+# pigpiod client that batches commands into fewer round trips, "recording" keeps waves and transmissions in
+# memory, "file" also writes every transmission to BACKEND_OUTPUT (see pipyir/backends.py)
+BACKEND = "pigpio"
+
+# File or named pipe the "file" backend writes to ("-" for stdout)
+BACKEND_OUTPUT = "-"
+
+# TCP port pipyir.cluster agents listen on for the show coordinator
+CLUSTER_PORT = 7878
+
+# Seconds between the coordinator starting a show and its first cue, so every agent has received the start
+CLUSTER_LEAD = 1.0
+
+# Ping round trips per clock offset measurement (the fastest one is used)
+CLUSTER_SYNC_ROUNDS = 8
+
+# Seconds between clock offset measurements while a show is playing, to follow clock drift
+CLUSTER_SYNC_INTERVAL = 10.0
+
+# Address the pipyir.server control server listens on
+CONTROL_HOST = "0.0.0.0"
+
+# UDP and TCP ports of the control server (None disables a listener)
+CONTROL_UDP_PORT = 7879
+CONTROL_TCP_PORT = 7879
+
+# Unix socket path of the control server (None disables it)
+CONTROL_UNIX_SOCKET = None
+
+# Address the Prometheus metrics endpoint listens on (see pipyir/metrics.py)
+METRICS_HOST = "127.0.0.1"
+
+# TCP port of the metrics endpoint (None disables it)
+METRICS_PORT = 9787
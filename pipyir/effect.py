@@ -0,0 +1,110 @@
+"""
+This module provides the Effect class, a compact immutable record for an IR code.
+An Effect stores its bits packed into a single int together with the bit count (so leading zeros, as in
+tail codes, are kept). It behaves like a read-only sequence of 0s and 1s, so code written for the old
+list-based effect definitions keeps working, and it is hashable so effects can be used as cache keys.
+"""
+
+class Effect:
+    __slots__ = ("bits", "length")
+
+    def __init__(self, bits, length):
+        """
+        :param bits: The bits packed into an int, first bit in the most significant position
+        :param length: Number of bits
+        """
+        if bits >> length:
+            raise ValueError(f"{bits:#b} does not fit in {length} bits")
+        self.bits = bits
+        self.length = length
+
+    @classmethod
+    def from_string(cls, text):
+        """
+        Builds an Effect from a string of 0s and 1s, e.g. "110010".
+
+        :param text: String of 0s and 1s
+        :return: Effect
+        """
+        return cls(int(text, 2) if text else 0, len(text))
+
+    @classmethod
+    def from_bits(cls, bit_list):
+        """
+        Builds an Effect from a list of bits.
+
+        :param bit_list: Iterable of bits (0s and 1s)
+        :return: Effect
+        """
+        if isinstance(bit_list, Effect):
+            return bit_list
+        return cls.from_string("".join("1" if bit else "0" for bit in bit_list))
+
+    def to_string(self):
+        return format(self.bits, f"0{self.length}b") if self.length else ""
+
+    def to_list(self):
+        return [int(bit) for bit in self.to_string()]
+
+    def to_run_lengths(self):
+        """
+        Counts the runs of consecutive equal bits, like bits_to_run_lengths_pulses.
+
+        :return: List of run lengths
+        """
+        run_lengths = []
+        text = self.to_string()
+        start = 0
+        for idx in range(1, len(text) + 1):
+            if idx == len(text) or text[idx] != text[start]:
+                run_lengths.append(idx - start)
+                start = idx
+        return run_lengths
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        bits = self.bits
+        for shift in range(self.length - 1, -1, -1):
+            yield (bits >> shift) & 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Effect.from_string(self.to_string()[index])
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Effect index out of range")
+        return (self.bits >> (self.length - 1 - index)) & 1
+
+    def __add__(self, other):
+        """
+        Returns a new Effect with the other bits appended, e.g. a base color effect plus a tail code.
+        Neither operand is changed.
+        """
+        try:
+            other = Effect.from_bits(other)
+        except TypeError:
+            return NotImplemented
+        return Effect((self.bits << other.length) | other.bits, self.length + other.length)
+
+    def __radd__(self, other):
+        try:
+            other = Effect.from_bits(other)
+        except TypeError:
+            return NotImplemented
+        return other + self
+
+    def __eq__(self, other):
+        if isinstance(other, Effect):
+            return self.bits == other.bits and self.length == other.length
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.bits, self.length))
+
+    def __repr__(self):
+        return f"Effect({self.to_string()!r})"
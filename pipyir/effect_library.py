@@ -0,0 +1,178 @@
+"""
+This module provides the EffectLibrary class, which compiles the bit lists in 'pipyir/effect_definitions.py'
+into run lengths once, when the library is created.
+Every base color effect, special effect and base color + tail code combination is compiled up front,
+so sending an effect is a single dictionary lookup with no bit list processing left to do.
+The module level 'effects' library is compiled from the shipped definitions at import time, and compose()
+looks up base + tail code combinations in it without ever modifying or copying the definition dicts.
+"""
+
+from pipyir.effect_definitions import base_color_effects, special_effects, tail_codes
+from pipyir.ir import bits_to_run_lengths_pulses
+
+BASE_COLOR = "base_color"
+SPECIAL = "special"
+TAIL = "tail"
+
+class CompiledEffect:
+    """
+    An effect compiled to an immutable tuple of run lengths, ready to hand to IRSender.send_raw_ir_command.
+    """
+    __slots__ = ("name", "tail_code", "category", "bit_count", "first_bit", "last_bit", "run_lengths")
+
+    def __init__(self, name, tail_code, category, bit_count, first_bit, last_bit, run_lengths):
+        """
+        :param name: The main effect name (string)
+        :param tail_code: The tail code name (string or None)
+        :param category: One of BASE_COLOR, SPECIAL or TAIL
+        :param bit_count: Number of bits in the whole effect
+        :param first_bit: Value of the first bit
+        :param last_bit: Value of the last bit
+        :param run_lengths: Tuple of run lengths of the whole effect
+        """
+        self.name = name
+        self.tail_code = tail_code
+        self.category = category
+        self.bit_count = bit_count
+        self.first_bit = first_bit
+        self.last_bit = last_bit
+        self.run_lengths = run_lengths
+
+    @classmethod
+    def from_bits(cls, name, category, bits):
+        """
+        Compiles a bit list.
+
+        :param name: The effect name (string)
+        :param category: One of BASE_COLOR, SPECIAL or TAIL
+        :param bits: List of bits (0s and 1s)
+        :return: The CompiledEffect
+        """
+        return cls(name, None, category, len(bits), bits[0], bits[-1], tuple(bits_to_run_lengths_pulses(bits)))
+
+    def with_tail(self, tail):
+        """
+        Compiles this effect followed by a tail code by joining the run lengths, without touching any bits.
+
+        :param tail: Compiled tail code (CompiledEffect)
+        :return: The combined CompiledEffect
+        """
+        if self.last_bit == tail.first_bit:
+            # The last run of the effect continues into the first run of the tail
+            run_lengths = (self.run_lengths[:-1] + (self.run_lengths[-1] + tail.run_lengths[0],) +
+                           tail.run_lengths[1:])
+        else:
+            run_lengths = self.run_lengths + tail.run_lengths
+        return CompiledEffect(self.name, tail.name, self.category, self.bit_count + tail.bit_count,
+                              self.first_bit, tail.last_bit, run_lengths)
+
+    def to_dict(self):
+        """
+        :return: The effect as a dict of JSON-serialisable values, e.g. to send it to another node
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuilds an effect serialised with to_dict.
+
+        :param data: Dict as returned by to_dict
+        :return: The CompiledEffect
+        """
+        return cls(data["name"], data["tail_code"], data["category"], data["bit_count"], data["first_bit"],
+                   data["last_bit"], tuple(data["run_lengths"]))
+
+    @property
+    def full_name(self):
+        return self.name if self.tail_code is None else f"{self.name} {self.tail_code}"
+
+    def __repr__(self):
+        return f"CompiledEffect({self.full_name!r}, {self.bit_count} bits, {len(self.run_lengths)} runs)"
+
+class EffectLibrary:
+    """
+    Precompiled lookup table of effects keyed by (main effect name, tail code name).
+    """
+    def __init__(self, base_effects, special_effects_, tail_codes_):
+        """
+        :param base_effects: Dict of base color effect names to bit lists
+        :param special_effects_: Dict of special effect names to bit lists
+        :param tail_codes_: Dict of tail code names to bit lists
+        """
+        self._effects = {}
+        self.base_names = tuple(base_effects)
+        self.special_names = tuple(special_effects_)
+        self.tail_names = tuple(tail_codes_)
+
+        self._tails = {name: CompiledEffect.from_bits(name, TAIL, bits) for name, bits in tail_codes_.items()}
+        for name, bits in base_effects.items():
+            effect = CompiledEffect.from_bits(name, BASE_COLOR, bits)
+            self._effects[(name, None)] = effect
+            for tail_name, tail in self._tails.items():
+                self._effects[(name, tail_name)] = effect.with_tail(tail)
+        for name, bits in special_effects_.items():
+            # Base color effects take precedence over special effects with the same name
+            self._effects.setdefault((name, None), CompiledEffect.from_bits(name, SPECIAL, bits))
+
+    def __len__(self):
+        return len(self._effects)
+
+    def __contains__(self, name):
+        return (name, None) in self._effects
+
+    def get(self, name, tail_code=None):
+        """
+        Looks up a compiled effect.
+
+        :param name: The main effect name (string)
+        :param tail_code: The tail code name (string or None)
+        :return: The CompiledEffect
+        :raises KeyError: If the effect or the effect + tail code combination is unknown
+        """
+        try:
+            return self._effects[(name, tail_code)]
+        except KeyError:
+            raise KeyError(f"Unknown effect: {name if tail_code is None else name + ' ' + tail_code}") from None
+
+    def compose(self, name, tail_code=None):
+        """
+        Returns the precompiled composite of an effect and an optional tail code, checking that they can be
+        combined. The result is shared and immutable; nothing is built or copied per call.
+
+        :param name: The main effect name (string)
+        :param tail_code: The tail code name (string or None)
+        :return: The CompiledEffect
+        :raises KeyError: If the effect or tail code is unknown
+        :raises ValueError: If the effect does not accept tail codes
+        """
+        effect = self.get(name)
+        if tail_code is None:
+            return effect
+        if tail_code not in self._tails:
+            raise KeyError(f"Unknown tail code: {tail_code}")
+        if effect.category != BASE_COLOR:
+            raise ValueError(f"Tail codes are only supported on base color effects, not {name}")
+        return self._effects[(name, tail_code)]
+
+    def tail(self, name):
+        """
+        Looks up a compiled tail code on its own.
+
+        :param name: The tail code name (string)
+        :return: The CompiledEffect
+        """
+        return self._tails[name]
+
+    def values(self):
+        return self._effects.values()
+
+# Library compiled from the shipped effect definitions
+effects = EffectLibrary(base_color_effects, special_effects, tail_codes)
+
+def compose(name, tail_code=None):
+    """
+    Returns the precompiled composite of an effect and an optional tail code from the shipped library.
+    See EffectLibrary.compose.
+    """
+    return effects.compose(name, tail_code)
@@ -0,0 +1,200 @@
+"""
+This module provides low-overhead instrumentation for the send path: counters, latency histograms per stage
+and a fixed-size ring buffer of recent events. Nothing is printed; the data is read on demand with dump()
+(or by sending SIGUSR1 once install_dump_signal() has been called) instead of being streamed to stdout.
+
+All storage is allocated up front. Recording is a few list and dict updates, and callers check
+'instrumentation.enabled' first, so disabled instrumentation costs one attribute lookup. A send records one
+latency and its counters; the event ring buffer costs a timestamp and a tuple per send, so it is only filled
+while 'record_events' is set (INSTRUMENTATION_EVENT_LOG).
+Updates are not locked: with several threads recording at once a count can occasionally be lost, which is
+acceptable for diagnostics and keeps the send path free of lock contention.
+
+The module level 'instrumentation' object is the one IRSender records to; INSTRUMENTATION in
+'pipyir/config.py' sets whether it starts enabled.
+"""
+
+import signal
+import sys
+import time
+
+import pipyir.config as cfg  # Import configuration settings
+
+# Histogram buckets: 4 per power of two, so a bucket's bounds are within 25% of each other, up to ~30 minutes
+HISTOGRAM_BUCKETS = 160
+
+# Counters and stages created up front, so recording them never allocates
+COUNTERS = ("sends", "send_failures", "cache_hits", "cache_misses", "waves_created", "wave_create_failures",
+            "holds", "batches", "zoned_sends", "airtime_us")
+STAGES = ("send", "encode", "create")
+
+def bucket_index(value):
+    """
+    :param value: Non-negative int (e.g. nanoseconds)
+    :return: Histogram bucket of the value
+    """
+    if value < 4:
+        return value
+    bits = value.bit_length()
+    return min(4 * (bits - 2) + ((value >> (bits - 3)) & 3), HISTOGRAM_BUCKETS - 1)
+
+def bucket_lower_bound(index):
+    """
+    :param index: Histogram bucket
+    :return: Smallest value that falls into the bucket
+    """
+    if index < 4:
+        return index
+    return (4 + index % 4) << (index // 4 - 1)
+
+class Histogram:
+    """
+    Log-linear histogram of non-negative ints.
+    """
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value):
+        # bucket_index inlined, since this runs for every send
+        bits = value.bit_length()
+        index = value if bits < 3 else 4 * bits - 8 + ((value >> (bits - 3)) & 3)
+        self.counts[index if index < HISTOGRAM_BUCKETS else HISTOGRAM_BUCKETS - 1] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction):
+        """
+        :param fraction: 0 to 1, e.g. 0.99
+        :return: Upper bound of the bucket holding the percentile (0 if empty)
+        """
+        if not self.count:
+            return 0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                if index + 1 == HISTOGRAM_BUCKETS:
+                    return self.max
+                return min(bucket_lower_bound(index + 1) - 1, self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def clear(self):
+        self.counts = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+class Instrumentation:
+    def __init__(self, enabled=True, event_capacity=256, record_events=False):
+        """
+        :param enabled: Whether recording starts enabled
+        :param event_capacity: Number of recent events kept in the ring buffer
+        :param record_events: Whether events are added to the ring buffer (while recording is enabled)
+        """
+        self.enabled = enabled
+        self.record_events = record_events
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.stages = {stage: Histogram() for stage in STAGES}
+        self._events = [None] * event_capacity
+        self._event_count = 0
+        self.started = time.monotonic()
+
+    def count(self, name, amount=1):
+        counters = self.counters
+        counters[name] = counters.get(name, 0) + amount
+
+    def observe(self, stage, duration_ns):
+        """
+        Records the duration of a stage.
+
+        :param stage: Stage name, e.g. "send"
+        :param duration_ns: Duration (in nanoseconds)
+        """
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = Histogram()
+        histogram.add(duration_ns)
+
+    def event(self, kind, name=None, detail=None):
+        """
+        Adds an event to the ring buffer, overwriting the oldest one once it is full.
+
+        :param kind: Short event type, e.g. "send"
+        :param name: Effect name or other subject of the event
+        :param detail: Any extra value, e.g. a wave ID
+        """
+        if not self.record_events:
+            return
+        events = self._events
+        events[self._event_count % len(events)] = (time.monotonic(), kind, name, detail)
+        self._event_count += 1
+
+    def events(self):
+        """
+        :return: List of recent events as (timestamp, kind, name, detail), oldest first
+        """
+        capacity = len(self._events)
+        if self._event_count <= capacity:
+            return self._events[:self._event_count]
+        start = self._event_count % capacity
+        return self._events[start:] + self._events[:start]
+
+    def reset(self):
+        for name in self.counters:
+            self.counters[name] = 0
+        for histogram in self.stages.values():
+            histogram.clear()
+        self._events = [None] * len(self._events)
+        self._event_count = 0
+        self.started = time.monotonic()
+
+    def dump(self, events=20):
+        """
+        Formats the counters, stage latencies and the most recent events.
+
+        :param events: Number of recent events to include
+        :return: Report text
+        """
+        lines = [f"pipyir instrumentation, {time.monotonic() - self.started:.1f} s"]
+        lines += [f"  {name:22} {value}" for name, value in self.counters.items()]
+        lines.append(f"  {'stage':10} {'count':>8} {'mean us':>10} {'p50 us':>10} {'p99 us':>10} {'max us':>10}")
+        for stage, histogram in self.stages.items():
+            if histogram.count:
+                lines.append(f"  {stage:10} {histogram.count:8} {histogram.mean / 1e3:10.1f} "
+                             f"{histogram.percentile(0.5) / 1e3:10.1f} {histogram.percentile(0.99) / 1e3:10.1f} "
+                             f"{histogram.max / 1e3:10.1f}")
+        recent = self.events()[-events:] if events else []
+        if recent:
+            lines.append("  recent events:")
+            lines += [f"    {timestamp:.6f} {kind} {name if name is not None else ''} "
+                      f"{detail if detail is not None else ''}".rstrip()
+                      for timestamp, kind, name, detail in recent]
+        return "\n".join(lines)
+
+# Instrumentation IRSender records to
+instrumentation = Instrumentation(cfg.INSTRUMENTATION, cfg.INSTRUMENTATION_EVENTS, cfg.INSTRUMENTATION_EVENT_LOG)
+
+def install_dump_signal(signum=None, stream=None):
+    """
+    Prints the instrumentation dump whenever the process receives a signal, e.g. 'kill -USR1 <pid>'.
+    Must be called from the main thread.
+
+    :param signum: Signal number, defaults to SIGUSR1
+    :param stream: Stream to print to, defaults to stderr
+    """
+    def handler(_signum, _frame):
+        print(instrumentation.dump(), file=stream or sys.stderr, flush=True)
+
+    signal.signal(signal.SIGUSR1 if signum is None else signum, handler)
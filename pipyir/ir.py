@@ -2,13 +2,37 @@
 """
 This module provides the IRSender class for sending IR signals using the Raspberry Pi GPIO pins.
 Configuration settings are loaded from 'pipyir/config.py'.
-The IRSender class uses the 'pigpio' library to generate accurate waveforms for IR communication.
-It also provides the bits_to_run_lengths_pulses function for converting bits to run lengths.
+The IRSender class drives pigpio through a backend from 'pipyir/backends.py' to generate accurate waveforms
+for IR communication, on one or several GPIOs, with created waves kept in a bounded WaveCache for reuse.
+Sends return a Transmission (or Hold) handle instead of blocking, and are recorded by the instrumentation in
+'pipyir/instrument.py'.
+It also provides the bits_to_run_lengths_pulses function for converting bits to run lengths, and the encoders
+turning run lengths into pigpio pulses or wave chains.
 """
 
+import heapq
+import math
+import threading
 import time
-import pigpio
+from collections import OrderedDict
 import pipyir.config as cfg  # Import configuration settings
+from pipyir.backends import (DEFAULT_MAX_WAVES, MAX_CHAIN_BYTES, MAX_CHAIN_LOOPS, OUTPUT, PULSE_STRUCT, Pulse,
+                             chain_loop_count, create_backend)
+from pipyir.effect import Effect
+from pipyir.instrument import instrumentation
+
+# Carrier generation modes, see CARRIER_MODE in config.py
+CARRIER_MODE_PULSES = "pulses"
+CARRIER_MODE_CHAIN = "chain"
+
+# Longest repeating carrier pattern (in cycles) that run_lengths_to_packed copies instead of packing each cycle
+MAX_CARRIER_BLOCK_CYCLES = 1000
+
+# Marks needing more carrier blocks than this loop the block wave, fewer list it once per block (a loop takes 7 bytes)
+MAX_LISTED_BLOCKS = 7
+
+# Poll interval (in seconds) used when TX_VERIFY_POLL confirms a transmission has finished
+TX_VERIFY_POLL_INTERVAL = 0.0002
 
 def group_by(iterable):
 
@@ -40,89 +64,1193 @@ def bits_to_run_lengths_pulses(bit_list):
     """
     Converts a list of bits into run lengths by counting consecutive bits.
 
-    :param bit_list: List of bits (0s and 1s)
+    :param bit_list: List of bits (0s and 1s), or an Effect
     :return: List of run lengths
     """
+    if isinstance(bit_list, Effect):
+        return bit_list.to_run_lengths()
     run_lengths = []
     for _, group in group_by(bit_list):
         run_lengths.append(len(group))
     return run_lengths
 
+def carrier_edge_us(edge, carrier_freq):
+    """
+    Computes when a carrier edge falls, counted from the start of a mark.
+    Edge times are the exact multiples of the half period rounded to whole microseconds, so the half-period
+    delays between them alternate (13 and 14 us at 38 kHz) and the rounding error never accumulates.
+
+    :param edge: Index of the edge (0 is the start of the mark, 2 the end of the first cycle, ...)
+    :param carrier_freq: Carrier frequency (in Hz)
+    :return: Edge time (in microseconds)
+    """
+    return int((edge * 1000000 + carrier_freq) // (2 * carrier_freq))
+
+def carrier_half_periods(count, carrier_freq):
+    """
+    :param count: Number of half periods
+    :param carrier_freq: Carrier frequency (in Hz)
+    :return: List of the first count half-period delays of a mark (in microseconds)
+    """
+    return [carrier_edge_us(edge + 1, carrier_freq) - carrier_edge_us(edge, carrier_freq) for edge in range(count)]
+
+def carrier_block_cycles(carrier_freq):
+    """
+    Finds the number of carrier cycles after which the half-period pattern repeats, i.e. the first cycle
+    boundary falling on a whole microsecond (19 cycles, 500 us, at 38 kHz).
+
+    :param carrier_freq: Carrier frequency (in Hz)
+    :return: Number of cycles, or None if the pattern does not repeat within MAX_CARRIER_BLOCK_CYCLES
+    """
+    if carrier_freq != int(carrier_freq):
+        return None
+    cycles = int(carrier_freq) // math.gcd(int(carrier_freq), 1000000)
+    return cycles if cycles <= MAX_CARRIER_BLOCK_CYCLES else None
+
+def mark_timing(duration_us, carrier_freq):
+    """
+    Splits a mark into whole carrier cycles and a remainder.
+
+    :param duration_us: Mark duration, rounded to whole microseconds
+    :param carrier_freq: Carrier frequency (in Hz)
+    :return: Tuple of (number of whole cycles, remaining on time, remaining off time) (times in microseconds)
+    """
+    num_cycles = int(duration_us * carrier_freq // 1000000)
+    remaining = duration_us - carrier_edge_us(2 * num_cycles, carrier_freq)
+    # The remainder is a partial cycle: on for up to half a period, then off for at least 1 us, so a mark
+    # never leaves the LED on when the wave ends
+    half = carrier_edge_us(2 * num_cycles + 1, carrier_freq) - carrier_edge_us(2 * num_cycles, carrier_freq)
+    remaining_on = max(0, min(remaining - 1, half))
+    return num_cycles, remaining_on, remaining - remaining_on
+
+def run_lengths_to_pulses(run_lengths, gpio_mask, unit, carrier_freq):
+    """
+    Builds the pigpio pulse list for a sequence of run lengths.
+    Marks and spaces last exactly their nominal time (rounded to whole microseconds), and the carrier runs at
+    carrier_freq on average (see carrier_edge_us).
+
+    :param run_lengths: List of run lengths corresponding to marks and spaces
+    :param gpio_mask: Bit mask of the GPIO pins driving the IR LED
+    :param unit: Base unit time for one bit (in microseconds)
+    :param carrier_freq: Carrier frequency (in Hz)
+    :return: List of Pulse objects
+    """
+    wave = []
+    for idx, duration_units in enumerate(run_lengths):
+        duration_us = int(round(duration_units * unit))
+        if idx % 2 == 0:
+            # Mark: carrier on
+            num_cycles, remaining_on, remaining_off = mark_timing(duration_us, carrier_freq)
+            delays = carrier_half_periods(2 * num_cycles, carrier_freq)
+            for cycle in range(num_cycles):
+                wave.append(Pulse(gpio_mask, 0, delays[2 * cycle]))
+                wave.append(Pulse(0, gpio_mask, delays[2 * cycle + 1]))
+            if remaining_on > 0:
+                wave.append(Pulse(gpio_mask, 0, remaining_on))
+            if remaining_off > 0:
+                wave.append(Pulse(0, gpio_mask, remaining_off))
+        else:
+            # Space: carrier off
+            wave.append(Pulse(0, gpio_mask, duration_us))
+    return wave
+
+def run_lengths_to_packed(run_lengths, gpio_mask, unit, carrier_freq):
+    """
+    Builds the same pulses as run_lengths_to_pulses, directly in pigpio's wire format (see PULSE_STRUCT).
+    A mark's carrier cycles are cut from one packed block of repeating cycles, so no per-pulse objects are created.
+
+    :param run_lengths: List of run lengths corresponding to marks and spaces
+    :param gpio_mask: Bit mask of the GPIO pins driving the IR LED
+    :param unit: Base unit time for one bit (in microseconds)
+    :param carrier_freq: Carrier frequency (in Hz)
+    :return: bytearray to pass to wave_add_packed
+    """
+    def pack_cycles(count):
+        delays = carrier_half_periods(2 * count, carrier_freq)
+        return b"".join(PULSE_STRUCT.pack(gpio_mask, 0, delays[i]) + PULSE_STRUCT.pack(0, gpio_mask, delays[i + 1])
+                        for i in range(0, 2 * count, 2))
+
+    block_cycles = carrier_block_cycles(carrier_freq)
+    block = pack_cycles(block_cycles) if block_cycles else None
+    cycle_size = 2 * PULSE_STRUCT.size
+
+    data = bytearray()
+    for idx, duration_units in enumerate(run_lengths):
+        duration_us = int(round(duration_units * unit))
+        if idx % 2 == 0:
+            # Mark: carrier on
+            num_cycles, remaining_on, remaining_off = mark_timing(duration_us, carrier_freq)
+            if block is None:
+                data += pack_cycles(num_cycles)
+            else:
+                full_blocks, cycles = divmod(num_cycles, block_cycles)
+                data += block * full_blocks
+                data += block[:cycles * cycle_size]
+            if remaining_on > 0:
+                data += PULSE_STRUCT.pack(gpio_mask, 0, remaining_on)
+            if remaining_off > 0:
+                data += PULSE_STRUCT.pack(0, gpio_mask, remaining_off)
+        else:
+            # Space: carrier off
+            data += PULSE_STRUCT.pack(0, gpio_mask, duration_us)
+    return data
+
+def carrier_timing(data, gpio_mask, carrier_freq):
+    """
+    Measures the carrier in packed pulses (see run_lengths_to_packed), e.g. to check the achieved frequency.
+    Carrier cycles are on/off pairs shorter than 1.5 nominal periods; longer off times are spaces. Pairs shorter
+    than a whole microsecond period are the remainders cut off at the end of a mark: they count toward the duty
+    cycle but not toward the frequency.
+
+    :param data: Pulses in pigpio's wire format
+    :param gpio_mask: Bit mask of the GPIO pins driving the IR LED
+    :param carrier_freq: Nominal carrier frequency (in Hz)
+    :return: Dict with the achieved "frequency" (in Hz), "duty_cycle" (0 to 1), number of "cycles" and the
+             total "airtime_us"
+    """
+    # Merge pulses into alternating on/off levels of the LED
+    levels = []  # [is_on, duration]
+    on = False
+    for gpio_on, gpio_off, delay in PULSE_STRUCT.iter_unpack(data):
+        if gpio_on & gpio_mask:
+            on = True
+        elif gpio_off & gpio_mask:
+            on = False
+        if levels and levels[-1][0] == on:
+            levels[-1][1] += delay
+        else:
+            levels.append([on, delay])
+
+    max_cycle_us = 1.5e6 / carrier_freq
+    min_cycle_us = int(1e6 / carrier_freq)
+    cycles = cycle_us = on_us = carrier_us = 0
+    for (is_on, on_time), (_, off_time) in zip(levels, levels[1:]):
+        if is_on and on_time + off_time < max_cycle_us:
+            carrier_us += on_time + off_time
+            on_us += on_time
+            if on_time + off_time >= min_cycle_us:
+                cycles += 1
+                cycle_us += on_time + off_time
+    return {
+        "frequency": cycles * 1e6 / cycle_us if cycle_us else 0.0,
+        "duty_cycle": on_us / carrier_us if carrier_us else 0.0,
+        "cycles": cycles,
+        "airtime_us": sum(duration for _, duration in levels),
+    }
+
+def gpios_to_mask(gpios):
+    """
+    :param gpios: Iterable of GPIO numbers
+    :return: GPIO bit mask with a bit set per GPIO
+    """
+    mask = 0
+    for gpio in gpios:
+        mask |= 1 << gpio
+    return mask
+
+def merge_pulse_tracks(tracks):
+    """
+    Merges packed pulses for disjoint groups of GPIOs into a single wave, so each group can send a different
+    command in the same time window. All tracks start together; the merged wave lasts as long as the longest.
+
+    :param tracks: List of packed pulse buffers (see run_lengths_to_packed), one per group of GPIOs
+    :return: bytearray of packed pulses
+    """
+    def edges(data):
+        now = 0
+        for gpio_on, gpio_off, delay in PULSE_STRUCT.iter_unpack(data):
+            yield now, gpio_on, gpio_off
+            now += delay
+        yield now, 0, 0  # End of the track
+
+    merged = bytearray()
+    pending = None  # [time, gpio_on, gpio_off] of the pulse being merged
+    for now, gpio_on, gpio_off in heapq.merge(*(edges(data) for data in tracks)):
+        if pending is not None and now == pending[0]:
+            pending[1] |= gpio_on
+            pending[2] |= gpio_off
+            continue
+        if pending is not None:
+            merged += PULSE_STRUCT.pack(pending[1], pending[2], now - pending[0])
+        pending = [now, gpio_on, gpio_off]
+    # The last pending entry is the end of the longest track, which switches nothing
+    return merged
+
+def chain_delay(chain, duration_us):
+    """
+    Appends a delay to a pigpio wave_chain command list, splitting delays longer than the 16 bit limit.
+
+    :param chain: bytearray holding the chain being built
+    :param duration_us: Delay (in microseconds)
+    """
+    duration_us = int(round(duration_us))
+    while duration_us > 0:
+        step = min(duration_us, 0xFFFF)
+        chain += bytes((255, 2, step & 0xFF, step >> 8))
+        duration_us -= step
+
+def chain_block_cycles(carrier_freq):
+    """
+    :param carrier_freq: Carrier frequency (in Hz)
+    :return: Number of carrier cycles in the block wave chain mode repeats for marks (see carrier_block_cycles)
+    """
+    return carrier_block_cycles(carrier_freq) or 1
+
+def run_lengths_to_chain(run_lengths, block_wid, block_us, tail_wid, unit):
+    """
+    Builds a pigpio wave_chain command list for a sequence of run lengths.
+    Each mark sends the carrier block wave as often as it fits (in a loop for long marks), then a wave with the
+    rest of the mark; each space is a chain delay. Since the block ends on the carrier's repeating pattern,
+    the result has the same timing as run_lengths_to_packed.
+
+    :param run_lengths: List of run lengths corresponding to marks and spaces
+    :param block_wid: Wave ID of the carrier block (chain_block_cycles whole carrier cycles)
+    :param block_us: Length of the carrier block (in microseconds)
+    :param tail_wid: Function returning the ID of the wave holding the rest of a mark, given its length in us
+    :param unit: Base unit time for one bit (in microseconds)
+    :return: bytes to pass to wave_chain
+    :raises ValueError: If the chain exceeds pigpio's length or loop limits
+    """
+    chain = bytearray()
+    loops = 0
+    for idx, duration_units in enumerate(run_lengths):
+        duration_us = int(round(duration_units * unit))
+        if idx % 2 == 0:
+            # Mark: whole carrier blocks, then the rest of the mark
+            blocks, remaining_us = divmod(duration_us, block_us)
+            if blocks > MAX_LISTED_BLOCKS:
+                chain += bytes((255, 0, block_wid, 255, 1, blocks & 0xFF, blocks >> 8))
+                loops += 1
+            else:
+                chain += bytes((block_wid,)) * blocks
+            if remaining_us:
+                chain.append(tail_wid(remaining_us))
+        else:
+            # Space: carrier off
+            chain_delay(chain, duration_us)
+    if len(chain) > MAX_CHAIN_BYTES:
+        raise ValueError(f"Command too long for a wave chain ({len(chain)} > {MAX_CHAIN_BYTES} bytes)")
+    if loops > MAX_CHAIN_LOOPS:
+        raise ValueError(f"Command has too many loops for a wave chain ({loops} > {MAX_CHAIN_LOOPS})")
+    return bytes(chain)
+
+def run_lengths_airtime_us(run_lengths, unit):
+    """
+    Computes how long a sequence of run lengths takes to transmit.
+
+    :param run_lengths: List of run lengths corresponding to marks and spaces
+    :param unit: Base unit time for one bit (in microseconds)
+    :return: Airtime (in microseconds)
+    """
+    return sum(run_lengths) * unit
+
+class Transmission:
+    """
+    Handle for a wave or wave chain handed to pigpio.
+
+    The end of the transmission is computed from the expected airtime when it starts, so waiting is a single
+    sleep. With TX_VERIFY_POLL enabled, wait() also polls pigpio briefly to confirm the transmitter is idle.
+    A Transmission can be waited on, awaited from asyncio code, or ignored.
+    """
+    __slots__ = ("start", "airtime", "end", "_sender", "_delete_wid", "_finished", "_tag")
+
+    def __init__(self, sender, airtime_us, delete_wid=None, tag=None):
+        """
+        :param sender: IRSender that started the transmission
+        :param airtime_us: Expected airtime (in microseconds)
+        :param delete_wid: Wave ID to delete once the transmission is done (for uncached waves)
+        :param tag: (name, pulse count) of the command, passed to the sender's profile hooks
+        """
+        self.start = time.monotonic()
+        self.airtime = airtime_us / 1e6
+        self.end = self.start + self.airtime
+        self._sender = sender
+        self._delete_wid = delete_wid
+        self._finished = False
+        self._tag = tag or (None, None)
+
+    def remaining(self):
+        """
+        :return: Seconds until the transmission is expected to finish (0 once it is done)
+        """
+        return max(0.0, self.end - time.monotonic())
+
+    def done(self):
+        return self._finished or time.monotonic() >= self.end
+
+    def wait(self):
+        """
+        Blocks until the transmission has finished, then releases its wave if it was not cached.
+        """
+        if self._finished:
+            return
+        sender = self._sender
+        if sender._profile_hooks:
+            started = time.perf_counter_ns()
+        delay = self.end - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        pi = sender.pi
+        if cfg.TX_VERIFY_POLL:
+            while pi.wave_tx_busy():
+                time.sleep(TX_VERIFY_POLL_INTERVAL)
+        self._finished = True
+        if sender._profile_hooks:
+            sender._profile("wait", started, *self._tag)
+        if self._delete_wid is not None:
+            if sender._profile_hooks:
+                started = time.perf_counter_ns()
+            pi.wave_delete(self._delete_wid)
+            self._delete_wid = None
+            if sender._profile_hooks:
+                sender._profile("delete", started, *self._tag)
+
+    def __await__(self):
+        # Only the expected airtime is awaited: polling pigpio and deleting the wave are left to the sending
+        # thread, whose next send (or cleanup) still waits on this transmission
+        import asyncio
+        delay = self.remaining()
+        if delay > 0:
+            yield from asyncio.sleep(delay).__await__()
+        return self
+
+class Hold:
+    """
+    Handle for a command that pigpio repeats with wave_send_repeat, see IRSender.hold().
+
+    The hold is stopped in the gap between two repeats, so the bracelets never see a cut off code. A hold with
+    a duration is stopped at its deadline by a timer thread, unless it is waited on or cancelled first.
+    """
+    def __init__(self, sender, wid, airtime_us, gap_us, duration, tag=None):
+        """
+        :param sender: IRSender that started the hold
+        :param wid: Wave ID of the repeated wave, owned by the hold
+        :param airtime_us: Airtime of the command itself (in microseconds)
+        :param gap_us: Gap after each repeat (in microseconds)
+        :param duration: Seconds to hold for, or None to hold until cancelled
+        :param tag: (name, pulse count) of the command, passed to the sender's profile hooks
+        """
+        self.start = time.monotonic()
+        self.period = (airtime_us + gap_us) / 1e6
+        self.deadline = None if duration is None else self.start + duration
+        self._code_time = airtime_us / 1e6
+        self._sender = sender
+        self._wid = wid
+        self._tag = tag or (None, None)
+        self._stopped = threading.Event()
+        self._stop_lock = threading.Lock()  # cancel() may race the sender stopping the hold
+        self._timer = None
+        if self.deadline is not None:
+            self._timer = threading.Timer(self._next_gap(self.deadline) - self.start, self._stop)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _next_gap(self, when):
+        """
+        :param when: time.monotonic() value
+        :return: The first time at or after 'when' that falls in the gap between two repeats
+        """
+        cycle_start = self.start + ((when - self.start) // self.period) * self.period
+        code_end = cycle_start + self._code_time
+        if when < code_end:
+            return code_end + (self.period - self._code_time) / 2
+        return when
+
+    def remaining(self):
+        """
+        :return: Seconds until the deadline (0 if there is none or it has passed)
+        """
+        if self.deadline is None:
+            return 0.0
+        return max(0.0, self.deadline - time.monotonic())
+
+    def done(self):
+        return self._stopped.is_set()
+
+    def cancel(self):
+        """
+        Stops the hold at the next gap between repeats.
+        """
+        if self._stopped.is_set():
+            return
+        stop_at = self._next_gap(time.monotonic())
+        delay = stop_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._stop()
+
+    def wait(self):
+        """
+        Blocks until the hold is over: until the deadline, or until cancel() is called from another thread.
+        """
+        if self.deadline is None:
+            self._stopped.wait()
+            return
+        if not self._stopped.is_set():
+            delay = self._next_gap(self.deadline) - time.monotonic()
+            if delay > 0:
+                self._stopped.wait(delay)
+            self._stop()
+
+    def _stop(self):
+        with self._stop_lock:
+            if self._stopped.is_set():
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+            sender = self._sender
+            sender.pi.wave_tx_stop()
+            if instrumentation.enabled:
+                # The hold was on air from its start until now, repeats and gaps included
+                instrumentation.count("airtime_us", int((time.monotonic() - self.start) * 1e6))
+            if sender._profile_hooks:
+                started = time.perf_counter_ns()
+            sender.pi.wave_delete(self._wid)
+            if sender._profile_hooks:
+                sender._profile("delete", started, *self._tag)
+            self._stopped.set()
+
+class WaveCache:
+    """
+    Bounded LRU cache of pigpio wave IDs.
+
+    Waves are keyed by their run lengths plus the GPIO, unit and carrier settings they were built with.
+    The cache stays within both a wave count and a total pulse budget, since pigpio shares a single
+    pulse pool between all waves that exist at the same time.
+    Pinned waves are referenced by a wave chain that has not been sent yet and are never evicted.
+    """
+    def __init__(self, pi, max_waves, max_pulses=None):
+        """
+        :param pi: Connected backend (see pipyir/backends.py)
+        :param max_waves: Maximum number of waves kept alive (0 disables caching)
+        :param max_pulses: Maximum total pulses of cached waves (None asks pigpio for its limit)
+        """
+        self.pi = pi
+        self.max_waves = max_waves
+        if max_pulses is None:
+            max_pulses = pi.wave_get_max_pulses()
+        self.max_pulses = max_pulses
+        self._waves = OrderedDict()  # key -> (wave ID, pulse count)
+        self._pulse_total = 0
+        self._pinned = set()
+        self.hits = 0
+        self.misses = 0
+        # Called as profile(stage, started_ns, pulse_count) after the upload, create and delete stages
+        self.profile = None
+
+    def __len__(self):
+        return len(self._waves)
+
+    def __contains__(self, key):
+        return key in self._waves
+
+    def pulse_count(self, key):
+        """
+        :param key: Cache key of the wave
+        :return: Number of pulses of the cached wave, or None if it is not cached
+        """
+        entry = self._waves.get(key)
+        return None if entry is None else entry[1]
+
+    @property
+    def enabled(self):
+        return self.max_waves > 0
+
+    def get(self, key):
+        """
+        Looks up a cached wave and marks it as most recently used.
+
+        :param key: Cache key of the wave
+        :return: Wave ID, or None if the wave is not cached
+        """
+        entry = self._waves.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._waves.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def add(self, key, pulses):
+        """
+        Creates a wave from the pulses and stores it under the key, evicting old waves as needed.
+        When the cache is disabled the wave is created but not stored, and the caller owns it.
+
+        :param key: Cache key of the wave
+        :param pulses: Pulses packed in pigpio's wire format (bytes-like), or a list of Pulse objects
+        :return: Wave ID, or a negative pigpio error code (-1 if pinned waves leave no room)
+        """
+        packed = not isinstance(pulses, list)
+        pulse_count = len(pulses) // PULSE_STRUCT.size if packed else len(pulses)
+        if self.enabled and not self._make_room(pulse_count) and self._pinned:
+            return -1
+
+        wid = self._create(pulses, packed, pulse_count)
+        if wid < 0 and len(self._waves) > len(self._pinned):
+            # pigpio ran out of wave memory or IDs; drop every unpinned wave and retry once
+            while self.evict():
+                pass
+            wid = self._create(pulses, packed, pulse_count)
+
+        if wid >= 0 and self.enabled:
+            self._waves[key] = (wid, pulse_count)
+            self._pulse_total += pulse_count
+        return wid
+
+    def _create(self, pulses, packed, pulse_count):
+        profile = self.profile
+        if profile is not None:
+            started = time.perf_counter_ns()
+        self.pi.wave_add_new()
+        if packed:
+            self.pi.wave_add_packed(pulses)
+        else:
+            self.pi.wave_add_generic(pulses)
+        if profile is not None:
+            uploaded = time.perf_counter_ns()
+            profile("upload", started, pulse_count)
+            wid = self.pi.wave_create()
+            profile("create", uploaded, pulse_count)
+            return wid
+        return self.pi.wave_create()
+
+    def _make_room(self, pulse_count):
+        """
+        Evicts waves until a wave of pulse_count pulses fits within the limits.
+
+        :return: True if there is room
+        """
+        while (len(self._waves) >= self.max_waves or
+               self._pulse_total + pulse_count > self.max_pulses):
+            if not self.evict():
+                return False
+        return True
+
+    def trim(self):
+        """
+        Evicts waves until the cache is back within its limits, e.g. after pinned waves were released.
+        """
+        while (len(self._waves) > self.max_waves or self._pulse_total > self.max_pulses) and self.evict():
+            pass
+
+    def pin(self, key):
+        """
+        Protects a cached wave from eviction until unpin_all is called.
+
+        :param key: Cache key of the wave
+        """
+        self._pinned.add(key)
+
+    @property
+    def pinned(self):
+        return bool(self._pinned)
+
+    def unpin_all(self):
+        self._pinned.clear()
+
+    def evict(self):
+        """
+        Deletes the least recently used wave that is not pinned.
+
+        :return: True if a wave was deleted
+        """
+        for key in self._waves:
+            if key not in self._pinned:
+                break
+        else:
+            return False
+        wid, pulse_count = self._waves.pop(key)
+        self._pulse_total -= pulse_count
+        if self.profile is not None:
+            started = time.perf_counter_ns()
+            self.pi.wave_delete(wid)
+            self.profile("delete", started, pulse_count)
+        else:
+            self.pi.wave_delete(wid)
+        return True
+
+    def clear(self):
+        """
+        Deletes all cached waves.
+        """
+        self._pinned.clear()
+        while self._waves:
+            self.evict()
+
 class IRSender:
-    def __init__(self):
-        self.pi = pigpio.pi()
+    def __init__(self, backend=None, gpios=None):
+        """
+        :param backend: Backend to transmit with (see pipyir/backends.py), defaults to the BACKEND config setting
+        :param gpios: GPIO pins of the IR emitter banks, all driven by every send, defaults to IR_GPIOS
+        """
+        self.pi = backend if backend is not None else create_backend()
         if not self.pi.connected:
             raise RuntimeError("Failed to connect to pigpio daemon")
-        self.IR_GPIO = cfg.IR_GPIO
-        self.pi.set_mode(self.IR_GPIO, pigpio.OUTPUT)
+        if gpios is None:
+            gpios = cfg.IR_GPIOS if cfg.IR_GPIOS else [cfg.IR_GPIO]
+        self.gpios = tuple(sorted(set(gpios)))
+        if not self.gpios:
+            raise ValueError("IRSender needs at least one GPIO")
+        self.IR_GPIO = self.gpios[0]
+        self.gpio_mask = gpios_to_mask(self.gpios)
+        for gpio in self.gpios:
+            self.pi.set_mode(gpio, OUTPUT)
+        self.wave_cache = WaveCache(self.pi, cfg.WAVE_CACHE_SIZE, cfg.WAVE_CACHE_MAX_PULSES)
+        self.carrier_mode = cfg.CARRIER_MODE
+        self._carrier_blocks = {}  # Chain mode: carrier frequency -> (block wave ID, block length in us)
+        self._carrier_tails = {}  # Chain mode: (carrier frequency, length in us) -> wave ID of a mark's rest
+        self._chains = OrderedDict()  # key -> wave_chain bytes
+        self._pulse_data = OrderedDict()  # key -> packed pulses
+        self._transmission = None  # Most recent Transmission
+        self._profile_hooks = []
+        self._profile_name = None  # Name of the command being sent, for the profile hooks
+        if self.carrier_mode == CARRIER_MODE_CHAIN:
+            self._carrier_block(cfg.CARRIER_FREQUENCY)
+        elif self.carrier_mode != CARRIER_MODE_PULSES:
+            raise ValueError(f"Unknown carrier mode: {self.carrier_mode}")
         if cfg.DEBUG:
-            print(f"IRSender initialized on GPIO pin {self.IR_GPIO}")
+            print(f"IRSender initialized on GPIO pin{'s' if len(self.gpios) > 1 else ''} "
+                  f"{', '.join(str(gpio) for gpio in self.gpios)}")
+
+    def add_profile_hook(self, hook):
+        """
+        Registers a profiling hook, called after every stage of a send as hook(stage, duration_ns, name,
+        pulse_count), see 'pipyir/profiling.py' for the stages. Hooks run on the sending thread and should be quick.
+
+        :param hook: Callable, e.g. a StageProfiler
+        """
+        self._profile_hooks.append(hook)
+        self.wave_cache.profile = self._profile_cache
+
+    def remove_profile_hook(self, hook):
+        self._profile_hooks.remove(hook)
+        if not self._profile_hooks:
+            self.wave_cache.profile = None
+
+    def _profile(self, stage, started, name, pulse_count):
+        """
+        Passes the time since started (a time.perf_counter_ns() value) to the profile hooks.
+        """
+        duration = time.perf_counter_ns() - started
+        for hook in self._profile_hooks:
+            hook(stage, duration, name, pulse_count)
+
+    def _profile_cache(self, stage, started, pulse_count):
+        # Wave cache stages (including evictions) are tagged with the command being sent
+        self._profile(stage, started, self._profile_name, pulse_count)
+
+    def _create_carrier_wave(self, duration_us, carrier_freq):
+        """
+        Creates a wave holding a mark of the given length, for chain mode.
+
+        :param duration_us: Length of the mark (in microseconds)
+        :param carrier_freq: Carrier frequency (in Hz)
+        :return: Wave ID
+        """
+        self.pi.wave_add_new()
+        self.pi.wave_add_packed(run_lengths_to_packed([duration_us], self.gpio_mask, 1, carrier_freq))
+        wid = self.pi.wave_create()
+        if wid < 0:
+            raise RuntimeError("Error creating carrier wave")
+        return wid
+
+    def _carrier_block(self, carrier_freq):
+        """
+        Returns the carrier block wave chain mode repeats for marks, creating it on first use.
+
+        :param carrier_freq: Carrier frequency (in Hz)
+        :return: Tuple of (wave ID, block length in microseconds)
+        """
+        block = self._carrier_blocks.get(carrier_freq)
+        if block is None:
+            block_us = carrier_edge_us(2 * chain_block_cycles(carrier_freq), carrier_freq)
+            block = self._carrier_blocks[carrier_freq] = (self._create_carrier_wave(block_us, carrier_freq), block_us)
+        return block
+
+    def _carrier_tail(self, duration_us, carrier_freq):
+        """
+        Returns the wave holding the rest of a mark after its carrier blocks, creating it on first use.
+
+        :param duration_us: Length of the rest (in microseconds)
+        :param carrier_freq: Carrier frequency (in Hz)
+        :return: Wave ID
+        """
+        wid = self._carrier_tails.get((carrier_freq, duration_us))
+        if wid is None:
+            wid = self._carrier_tails[(carrier_freq, duration_us)] = self._create_carrier_wave(duration_us,
+                                                                                                carrier_freq)
+        return wid
+
+    def _get_chain(self, key, run_lengths, unit, carrier_freq):
+        """
+        Returns the wave_chain command list for the run lengths, building it on first use.
+        """
+        chain = self._chains.get(key)
+        if chain is None:
+            if self._profile_hooks:
+                started = time.perf_counter_ns()
+            block_wid, block_us = self._carrier_block(carrier_freq)
+            chain = run_lengths_to_chain(run_lengths, block_wid, block_us,
+                                         lambda duration_us: self._carrier_tail(duration_us, carrier_freq), unit)
+            if self._profile_hooks:
+                self._profile("pulses", started, self._profile_name, None)
+            if len(self._chains) >= max(cfg.WAVE_CACHE_SIZE, 1):
+                self._chains.popitem(last=False)
+            self._chains[key] = chain
+        else:
+            self._chains.move_to_end(key)
+        return chain
+
+    def _get_pulse_data(self, key, run_lengths, unit, carrier_freq):
+        """
+        Returns the packed pulses for the run lengths, building them on first use.
+        """
+        data = self._pulse_data.get(key)
+        if data is None:
+            if self._profile_hooks:
+                started = time.perf_counter_ns()
+            data = run_lengths_to_packed(run_lengths, self.gpio_mask, unit, carrier_freq)
+            if self._profile_hooks:
+                self._profile("pulses", started, self._profile_name, len(data) // PULSE_STRUCT.size)
+            self._store_pulse_data(key, data)
+        else:
+            self._pulse_data.move_to_end(key)
+        return data
+
+    def _store_pulse_data(self, key, data):
+        if cfg.PULSE_DATA_CACHE_SIZE > 0:
+            if len(self._pulse_data) >= cfg.PULSE_DATA_CACHE_SIZE:
+                self._pulse_data.popitem(last=False)
+            self._pulse_data[key] = data
 
-    def send_raw_ir_command(self, run_lengths):
+    def zone_mask(self, zone):
+        """
+        Resolves a zone to a GPIO mask.
+
+        :param zone: Zone name from IR_ZONES, a GPIO number, or an iterable of GPIO numbers
+        :return: GPIO bit mask
+        """
+        if isinstance(zone, str):
+            if zone not in cfg.IR_ZONES:
+                raise KeyError(f"Unknown zone: {zone}")
+            zone = cfg.IR_ZONES[zone]
+        gpios = [zone] if isinstance(zone, int) else list(zone)
+        for gpio in gpios:
+            if gpio not in self.gpios:
+                raise ValueError(f"GPIO {gpio} is not driven by this IRSender")
+        return gpios_to_mask(gpios)
+
+    def _wait_previous(self):
+        """
+        Waits for the previous transmission, since starting a new wave would cut it off.
+        A hold without a deadline is cancelled instead.
+        """
+        if self._transmission is not None:
+            if isinstance(self._transmission, Hold) and self._transmission.deadline is None:
+                self._transmission.cancel()
+            else:
+                self._transmission.wait()
+            self._transmission = None
+
+    def _send_chain(self, chain, airtime_us):
+        """
+        Starts transmitting a wave_chain command list.
+
+        :param chain: bytes or bytearray to pass to wave_chain
+        :param airtime_us: Expected airtime of the chain (in microseconds)
+        :return: Transmission, or None for an empty chain or if pigpio rejected it
+        """
+        if not chain:
+            return None
+        self._wait_previous()
+        if self._profile_hooks:
+            started = time.perf_counter_ns()
+            result = self.pi.wave_chain(chain)
+            self._profile("send", started, self._profile_name, None)
+        else:
+            result = self.pi.wave_chain(chain)
+        if result is not None and result < 0:
+            if cfg.DEBUG:
+                print(f"Error sending wave chain ({result})")
+            return None
+        self._transmission = Transmission(self, airtime_us, tag=(self._profile_name, None))
+        return self._transmission
+
+    def preload(self, run_lengths):
+        """
+        Builds and uploads the wave (or wave chain) for the run lengths ahead of time, so a later send of the
+        same command is just a transmit call. Does nothing in pulses mode with the wave cache disabled.
+
+        :param run_lengths: List of run lengths corresponding to marks and spaces
+        """
+        unit = cfg.PULSE_LENGTH
+        carrier_freq = cfg.CARRIER_FREQUENCY
+        key = (tuple(run_lengths), self.gpio_mask, unit, carrier_freq)
+        self._profile_name = None
+        if self.carrier_mode == CARRIER_MODE_CHAIN:
+            self._get_chain(key, run_lengths, unit, carrier_freq)
+        elif self.wave_cache.enabled and key not in self.wave_cache:
+            self._wait_previous()
+            self.wave_cache.add(key, self._get_pulse_data(key, run_lengths, unit, carrier_freq))
+
+    def send_raw_ir_command(self, run_lengths, wait=True, name=None):
         """
         Generates and sends the IR waveform based on run lengths of bits.
+        Waves already sent with the same settings are reused from the wave cache.
 
         :param run_lengths: List of run lengths corresponding to marks and spaces
+        :param wait: Whether to block until the command has been transmitted
+        :param name: Name of the command recorded by the instrumentation, e.g. the effect name
+        :return: Transmission, or None if the wave could not be created
         """
         unit = cfg.PULSE_LENGTH  # Use PULSE_LENGTH from config
         carrier_freq = cfg.CARRIER_FREQUENCY  # Use CARRIER_FREQUENCY from config
-        carrier_period = 1e6 / carrier_freq  # in microseconds
-        carrier_half_period = carrier_period / 2  # in microseconds
-
-        wave = []
-        for idx, duration_units in enumerate(run_lengths):
-            duration_us = duration_units * unit
-            if idx % 2 == 0:
-                # Mark: carrier on
-                num_cycles = int(duration_us / carrier_period)
-                for _ in range(num_cycles):
-                    wave.append(pigpio.pulse(1 << self.IR_GPIO, 0, int(carrier_half_period)))
-                    wave.append(pigpio.pulse(0, 1 << self.IR_GPIO, int(carrier_half_period)))
-                remaining_time = duration_us - (num_cycles * carrier_period)
-                if remaining_time > 0:
-                    wave.append(pigpio.pulse(1 << self.IR_GPIO, 0, int(remaining_time)))
-            else:
-                # Space: carrier off
-                wave.append(pigpio.pulse(0, 0, int(duration_us)))
+        airtime_us = run_lengths_airtime_us(run_lengths, unit)
 
-        # Send the waveform
-        self.pi.wave_add_generic(wave)
-        wid = self.pi.wave_create()
-        if wid >= 0:
+        # The previous wave may still be on air, and must not be evicted before it is done
+        self._wait_previous()
+        self._profile_name = name
+        instr = instrumentation
+        if instr.enabled:
+            started = time.perf_counter_ns()
+
+        key = (tuple(run_lengths), self.gpio_mask, unit, carrier_freq)
+        if self.carrier_mode == CARRIER_MODE_CHAIN:
+            transmission = self._send_chain(self._get_chain(key, run_lengths, unit, carrier_freq), airtime_us)
+            if transmission is None:
+                if instr.enabled:
+                    instr.count("send_failures")
+                    instr.event("error", name, "chain")
+                return None
+            detail = "chain"
+        else:
+            wid = self.wave_cache.get(key)
+            if wid is None:
+                data = self._get_pulse_data(key, run_lengths, unit, carrier_freq)
+                if instr.enabled:
+                    encoded = time.perf_counter_ns()
+                    instr.observe("encode", encoded - started)
+                wid = self.wave_cache.add(key, data)
+                if instr.enabled:
+                    instr.observe("create", time.perf_counter_ns() - encoded)
+                    instr.count("cache_misses")
+                    instr.count("wave_create_failures" if wid < 0 else "waves_created")
+            elif instr.enabled:
+                instr.counters["cache_hits"] += 1
+
+            # Send the waveform
+            if wid < 0:
+                if cfg.DEBUG:
+                    print(f"Error creating wave ({wid})")
+                if instr.enabled:
+                    instr.count("send_failures")
+                    instr.event("error", name, wid)
+                return None
+            if self._profile_hooks:
+                transmit_started = time.perf_counter_ns()
             self.pi.wave_send_once(wid)
-            while self.pi.wave_tx_busy():
-                time.sleep(0.001)
-            self.pi.wave_delete(wid)
+            tag = None
+            if self._profile_hooks:
+                pulse_count = self.wave_cache.pulse_count(key)
+                if pulse_count is None:
+                    pulse_count = len(data) // PULSE_STRUCT.size
+                tag = (name, pulse_count)
+                self._profile("send", transmit_started, name, pulse_count)
+            transmission = self._transmission = Transmission(
+                self, airtime_us, None if self.wave_cache.enabled else wid, tag)
+            detail = wid
+
+        if instr.enabled:
+            # Kept to one timestamp pair and plain counter updates, since this runs for every send
+            instr.stages["send"].add(time.perf_counter_ns() - started)
+            counters = instr.counters
+            counters["sends"] += 1
+            counters["airtime_us"] += airtime_us
+            if instr.record_events:
+                instr.event("send", name, detail)
+        if wait:
+            transmission.wait()
+        return transmission
+
+    def hold(self, command, duration=None, gap_us=None, wait=True):
+        """
+        Repeats a command in hardware: the wave is uploaded once and pigpio resends it back to back with
+        wave_send_repeat, so holding a color costs no CPU. Any later send stops the hold (waiting for its
+        deadline first, if it has one).
+
+        :param command: CompiledEffect or list of bits (0s and 1s)
+        :param duration: Seconds to hold for, or None to hold until Hold.cancel() or the next send
+        :param gap_us: Gap between repeats (in microseconds), defaults to WAIT_BEFORE_SEND
+        :param wait: Whether to block until the duration is over (ignored when holding until cancelled); without
+            waiting, the hold still stops at its deadline
+        :return: Hold, or None if the wave could not be created
+        """
+        unit = cfg.PULSE_LENGTH
+        carrier_freq = cfg.CARRIER_FREQUENCY
+        if gap_us is None:
+            gap_us = cfg.WAIT_BEFORE_SEND * 1e6
+        run_lengths = command.run_lengths if hasattr(command, "run_lengths") else \
+            bits_to_run_lengths_pulses(command)
+        airtime_us = run_lengths_airtime_us(run_lengths, unit)
+
+        self._wait_previous()
+        name = self._profile_name = getattr(command, "full_name", None)
+        # A repeated wave must be a single wave, so chain mode also builds the full pulse list here
+        key = (tuple(run_lengths), self.gpio_mask, unit, carrier_freq)
+        wave = self._get_pulse_data(key, run_lengths, unit, carrier_freq) + PULSE_STRUCT.pack(0, 0, int(gap_us))
+        # The hold owns its wave and deletes it when it stops, so the wave is created by a cache that keeps nothing
+        hold_wave = WaveCache(self.pi, 0, self.wave_cache.max_pulses)
+        hold_wave.profile = self.wave_cache.profile
+        wid = hold_wave.add(None, wave)
+        if wid < 0 and self.wave_cache.evict():
+            # Make room by dropping cached waves, which can be rebuilt later
+            while self.wave_cache.evict():
+                pass
+            wid = hold_wave.add(None, wave)
+        if wid < 0:
             if cfg.DEBUG:
-                print(f"IR command sent with waveform ID {wid}")
+                print(f"Error creating wave ({wid})")
+            if instrumentation.enabled:
+                instrumentation.count("wave_create_failures")
+            return None
+
+        tag = (name, len(wave) // PULSE_STRUCT.size)
+        if self._profile_hooks:
+            started = time.perf_counter_ns()
+            self.pi.wave_send_repeat(wid)
+            self._profile("send", started, *tag)
         else:
-            print("Error creating wave")
+            self.pi.wave_send_repeat(wid)
+        hold = self._transmission = Hold(self, wid, airtime_us, gap_us, duration, tag)
+        if instrumentation.enabled:
+            instrumentation.count("holds")
+            instrumentation.count("sends")
+            instrumentation.event("hold", name, wid)
+        if wait and duration is not None:
+            hold.wait()
+            self._transmission = None
+        return hold
 
-    def send_bits_command(self, bit_list):
+    def send_bits_command(self, bit_list, wait=True):
         """
         Converts a bit list into run_lengths and sends the corresponding IR command.
 
         :param bit_list: List of bits (0s and 1s)
+        :param wait: Whether to block until the command has been transmitted
+        :return: Transmission, or None if the wave could not be created
         """
-        run_lengths = bits_to_run_lengths_pulses(bit_list)
-        if cfg.DEBUG:
-            print(f"Sending bits: {bit_list}")
-            print(f"Run lengths: {run_lengths}")
-        self.send_raw_ir_command(run_lengths)
+        if self._profile_hooks:
+            started = time.perf_counter_ns()
+            run_lengths = bits_to_run_lengths_pulses(bit_list)
+            self._profile("run_lengths", started, None, None)
+        else:
+            run_lengths = bits_to_run_lengths_pulses(bit_list)
+        return self.send_raw_ir_command(run_lengths, wait)
+
+    def send_effect(self, effect, wait=True):
+        """
+        Sends an effect precompiled by pipyir.effect_library, skipping the bit list conversion.
+
+        :param effect: CompiledEffect to send
+        :param wait: Whether to block until the effect has been transmitted
+        :return: Transmission, or None if the wave could not be created
+        """
+        return self.send_raw_ir_command(effect.run_lengths, wait, effect.full_name)
 
-    def send_multiple_commands(self, command_list):
+    def send_zoned(self, zones, wait=True):
+        """
+        Sends different commands on different groups of GPIOs at the same time, as a single merged wave.
+        All commands start together; the wave lasts as long as the longest one.
+
+        :param zones: Dict mapping zones (see zone_mask) to CompiledEffects or lists of bits (0s and 1s)
+        :param wait: Whether to block until the commands have been transmitted
+        :return: Transmission, or None if the wave could not be created
+        """
+        unit = cfg.PULSE_LENGTH
+        carrier_freq = cfg.CARRIER_FREQUENCY
+        tracks = []
+        used_mask = 0
+        for zone, command in zones.items():
+            mask = self.zone_mask(zone)
+            if mask & used_mask:
+                raise ValueError(f"Zone {zone!r} overlaps another zone")
+            used_mask |= mask
+            run_lengths = command.run_lengths if hasattr(command, "run_lengths") else \
+                bits_to_run_lengths_pulses(command)
+            tracks.append((mask, tuple(run_lengths)))
+        if not tracks:
+            return None
+        tracks.sort()
+        airtime_us = max(run_lengths_airtime_us(run_lengths, unit) for _, run_lengths in tracks)
+
+        self._wait_previous()
+        name = self._profile_name = " + ".join(getattr(command, "full_name", "bits") for command in zones.values())
+        # Zoned waves are always full pulse waves, since the carrier waves of a chain drive every GPIO
+        key = ("zoned", tuple(tracks), unit, carrier_freq)
+        wid = self.wave_cache.get(key)
+        if wid is None:
+            data = self._pulse_data.get(key)
+            if data is None:
+                if self._profile_hooks:
+                    started = time.perf_counter_ns()
+                data = merge_pulse_tracks([run_lengths_to_packed(run_lengths, mask, unit, carrier_freq)
+                                           for mask, run_lengths in tracks])
+                if self._profile_hooks:
+                    self._profile("pulses", started, name, len(data) // PULSE_STRUCT.size)
+                self._store_pulse_data(key, data)
+            wid = self.wave_cache.add(key, data)
+        if wid < 0:
+            if cfg.DEBUG:
+                print(f"Error creating wave ({wid})")
+            if instrumentation.enabled:
+                instrumentation.count("wave_create_failures")
+            return None
+
+        tag = None
+        if self._profile_hooks:
+            pulse_count = self.wave_cache.pulse_count(key)
+            tag = (name, len(data) // PULSE_STRUCT.size if pulse_count is None else pulse_count)
+            started = time.perf_counter_ns()
+            self.pi.wave_send_once(wid)
+            self._profile("send", started, *tag)
+        else:
+            self.pi.wave_send_once(wid)
+        transmission = self._transmission = Transmission(
+            self, airtime_us, None if self.wave_cache.enabled else wid, tag)
+        if instrumentation.enabled:
+            instrumentation.count("zoned_sends")
+            instrumentation.count("sends")
+            instrumentation.count("airtime_us", airtime_us)
+            instrumentation.event("zoned", f"{len(tracks)} zones", wid)
+        if wait:
+            transmission.wait()
+        return transmission
+
+    def send_multiple_commands(self, command_list, batch=False, gap_us=None, wait=True):
         """
         Sends multiple IR commands.
+        In batch mode the commands are sent as wave chains holding as many commands as pigpio allows,
+        with the gap between commands encoded in the chain so it is timed by pigpio instead of Python.
 
-        :param command_list: List of bit lists
+        :param command_list: List of bit lists (or CompiledEffects)
+        :param batch: Whether to send the commands as wave chains
+        :param gap_us: Gap between commands in batch mode (in microseconds), defaults to WAIT_BEFORE_SEND
+        :param wait: Whether to block until the last command has been transmitted
+        :return: Transmission of the last command or chain, or None if nothing was sent
         """
+        transmission = None
+        if not batch:
+            for command in command_list:
+                if hasattr(command, "run_lengths"):
+                    transmission = self.send_effect(command, wait) or transmission
+                else:
+                    transmission = self.send_bits_command(command, wait) or transmission
+            return transmission
+
+        unit = cfg.PULSE_LENGTH
+        carrier_freq = cfg.CARRIER_FREQUENCY
+        if gap_us is None:
+            gap_us = cfg.WAIT_BEFORE_SEND * 1e6
+        gap = bytearray()
+        chain_delay(gap, gap_us)
+
+        self._wait_previous()
+        # The waves of a chain must all exist while it is sent, so a disabled cache gets a temporary one
+        cache = self.wave_cache if self.wave_cache.enabled else WaveCache(
+            self.pi, DEFAULT_MAX_WAVES, self.wave_cache.max_pulses)
+        cache.profile = self.wave_cache.profile
+        chain = bytearray()
+        chain_airtime_us = 0
+        chain_loops = 0
+        chain_commands = 0
+        batch_name = f"batch of {len(command_list)}"
+
+        def send_pending():
+            # Sends the pending chain, counting its commands once pigpio has accepted it
+            transmission = self._send_chain(chain, chain_airtime_us)
+            if instrumentation.enabled and chain:
+                if transmission is None:
+                    instrumentation.count("send_failures", chain_commands)
+                else:
+                    instrumentation.count("sends", chain_commands)
+                    instrumentation.count("airtime_us", chain_airtime_us)
+            return transmission
+
+        def flush():
+            # Sends the pending chain and waits for it, so its waves can be evicted again
+            nonlocal chain_airtime_us, chain_loops, chain_commands
+            name = self._profile_name
+            self._profile_name = batch_name
+            send_pending()
+            self._wait_previous()
+            self._profile_name = name
+            chain.clear()
+            chain_airtime_us = 0
+            chain_loops = 0
+            chain_commands = 0
+            cache.unpin_all()
+            cache.trim()
+
         for command in command_list:
-            self.send_bits_command(command)
+            run_lengths = command.run_lengths if hasattr(command, "run_lengths") else \
+                bits_to_run_lengths_pulses(command)
+            key = (tuple(run_lengths), self.gpio_mask, unit, carrier_freq)
+            self._profile_name = getattr(command, "full_name", None)
+
+            if self.carrier_mode == CARRIER_MODE_CHAIN:
+                entry = self._get_chain(key, run_lengths, unit, carrier_freq)
+            else:
+                wid = cache.get(key)
+                if wid is None:
+                    wave = self._get_pulse_data(key, run_lengths, unit, carrier_freq)
+                    wid = cache.add(key, wave)
+                    if wid < 0 and cache.pinned:
+                        # Wave memory is held by the pending chain; send it to free the waves and retry
+                        flush()
+                        wid = cache.add(key, wave)
+                    if wid < 0:
+                        if cfg.DEBUG:
+                            print(f"Error creating wave ({wid})")
+                        if instrumentation.enabled:
+                            instrumentation.count("wave_create_failures")
+                        continue
+                entry = bytes((wid,))
+
+            entry_loops = chain_loop_count(entry) if self.carrier_mode == CARRIER_MODE_CHAIN else 0
+            if len(chain) + len(entry) + len(gap) > MAX_CHAIN_BYTES or chain_loops + entry_loops > MAX_CHAIN_LOOPS:
+                flush()
+            if self.carrier_mode != CARRIER_MODE_CHAIN:
+                cache.pin(key)
+            chain += entry
+            chain += gap
+            chain_loops += entry_loops
+            chain_commands += 1
+            chain_airtime_us += run_lengths_airtime_us(run_lengths, unit) + gap_us
+
+        self._profile_name = batch_name
+        transmission = send_pending()
+        if cache is not self.wave_cache or wait:
+            self._wait_previous()
+        cache.unpin_all()
+        if cache is not self.wave_cache:
+            cache.clear()
+        if instrumentation.enabled:
+            instrumentation.count("batches")
+            instrumentation.event("batch", f"{len(command_list)} commands")
+        return transmission
 
     def cleanup(self):
         """
-        Cleans up the pigpio resources.
+        Cleans up the pigpio resources, deleting all cached waves first.
         """
+        self._wait_previous()
+        self.wave_cache.clear()
+        for wid, _ in self._carrier_blocks.values():
+            self.pi.wave_delete(wid)
+        for wid in self._carrier_tails.values():
+            self.pi.wave_delete(wid)
+        self._carrier_blocks.clear()
+        self._carrier_tails.clear()
         self.pi.stop()
         if cfg.DEBUG:
             print("IRSender cleaned up and pigpio connection closed.")
@@ -0,0 +1,179 @@
+"""
+This module serves the instrumentation of 'pipyir/instrument.py' as a Prometheus text endpoint, so unattended
+transmitters can be monitored and alerted on (stalls, pigpiod errors) instead of printing "Error creating wave".
+
+MetricsServer runs a small HTTP server on its own thread. A scrape only reads the counters and histograms that
+the send path already keeps: it takes no lock the transmitter could wait on, and the server thread runs at a
+lower CPU priority (on Linux) so it yields to the transmitter. For example:
+    metrics = MetricsServer(scheduler)
+    metrics.start()
+    ...
+    curl http://127.0.0.1:9787/metrics
+
+Totals are exported as counters; sends per second and airtime utilisation are computed over the interval since
+the previous scrape (or since the server started), so they are meant for a single scraper.
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pipyir.config as cfg  # Import configuration settings
+from pipyir.instrument import instrumentation
+
+# Content type of the Prometheus text format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Niceness added to the metrics server thread, so scrapes yield the CPU to the transmitter
+METRICS_THREAD_NICENESS = 10
+
+# Instrumentation counters exported as Prometheus counters: counter -> (metric name, help text)
+COUNTER_METRICS = {
+    "sends": ("pipyir_sends_total", "Commands sent."),
+    "send_failures": ("pipyir_send_failures_total", "Sends that failed because the wave could not be created."),
+    "wave_create_failures": ("pipyir_wave_create_failures_total", "pigpio wave_create calls that failed."),
+    "waves_created": ("pipyir_waves_created_total", "Waves created for the wave cache."),
+    "cache_hits": ("pipyir_wave_cache_hits_total", "Sends that reused a cached wave."),
+    "cache_misses": ("pipyir_wave_cache_misses_total", "Sends that had to create a wave."),
+    "holds": ("pipyir_holds_total", "Commands repeated with IRSender.hold."),
+    "batches": ("pipyir_batches_total", "Batches sent as wave chains."),
+    "zoned_sends": ("pipyir_zoned_sends_total", "Zoned sends."),
+}
+
+# Scheduler counters exported as Prometheus counters: attribute -> (metric name, help text)
+SCHEDULER_METRICS = {
+    "sent": ("pipyir_scheduler_sent_total", "Commands sent by the transmit scheduler."),
+    "coalesced": ("pipyir_scheduler_coalesced_total", "Commands dropped as duplicates of a pending one."),
+    "superseded": ("pipyir_scheduler_superseded_total", "Commands cancelled by a newer batch of their group."),
+    "preempted": ("pipyir_scheduler_preempted_total", "Commands cancelled by an urgent command."),
+    "dropped": ("pipyir_scheduler_dropped_total", "Commands dropped because the queue was full."),
+}
+
+def _lower_thread_priority():
+    """
+    Raises the niceness of the calling thread only (Linux applies setpriority to a thread ID).
+    """
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), METRICS_THREAD_NICENESS)
+    except (AttributeError, OSError):
+        pass
+
+class _HTTPServer(HTTPServer):
+    # Scrapes are handled one at a time on the (lower priority) server thread
+    allow_reuse_address = True
+
+class MetricsServer:
+    """
+    Serves the send counters, send latency, wave cache and transmit queue metrics over HTTP.
+    """
+    def __init__(self, scheduler=None, sender=None, host=None, port=None):
+        """
+        :param scheduler: TransmitScheduler whose queue depth and counters are exported (optional)
+        :param sender: IRSender whose wave cache size is exported, defaults to the scheduler's sender (optional)
+        :param host: Address to listen on, defaults to METRICS_HOST
+        :param port: TCP port to listen on, defaults to METRICS_PORT (0 picks a free port)
+        """
+        self.scheduler = scheduler
+        self.sender = sender if sender is not None or scheduler is None else scheduler.sender
+        # (time, sends, airtime_us) at the previous scrape
+        self._last = (time.monotonic(), instrumentation.counters["sends"], instrumentation.counters["airtime_us"])
+        self._thread = None
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            timeout = 5  # Seconds, so a stuck client cannot block later scrapes
+
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                if cfg.DEBUG:
+                    super().log_message(format, *args)
+
+        self.server = _HTTPServer((cfg.METRICS_HOST if host is None else host,
+                                   cfg.METRICS_PORT if port is None else port), Handler)
+
+    @property
+    def address(self):
+        return self.server.server_address
+
+    def render(self):
+        """
+        Formats the current metrics in the Prometheus text format.
+
+        :return: Metrics text
+        """
+        counters = dict(instrumentation.counters)  # Copied at once, the send path keeps updating them
+        now = time.monotonic()
+        last_time, last_sends, last_airtime_us = self._last
+        self._last = (now, counters["sends"], counters["airtime_us"])
+        elapsed = max(now - last_time, 1e-9)
+
+        lines = []
+
+        def metric(name, kind, help_text, value, labels=""):
+            if kind is not None:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name}{labels} {value}")
+
+        metric("pipyir_instrumentation_enabled", "gauge", "Whether the send path is being instrumented.",
+               int(instrumentation.enabled))
+        for counter, (name, help_text) in COUNTER_METRICS.items():
+            metric(name, "counter", help_text, counters[counter])
+        metric("pipyir_airtime_seconds_total", "counter", "IR airtime of the commands sent.",
+               counters["airtime_us"] / 1e6)
+        metric("pipyir_sends_per_second", "gauge", "Commands sent per second since the previous scrape.",
+               (counters["sends"] - last_sends) / elapsed)
+        metric("pipyir_airtime_utilisation_percent", "gauge",
+               "Share of the time since the previous scrape spent transmitting.",
+               min(100.0, (counters["airtime_us"] - last_airtime_us) / 1e4 / elapsed))
+        lookups = counters["cache_hits"] + counters["cache_misses"]
+        metric("pipyir_wave_cache_hit_ratio", "gauge", "Share of sends that reused a cached wave.",
+               counters["cache_hits"] / lookups if lookups else 0.0)
+
+        histogram = instrumentation.stages["send"]
+        metric("pipyir_send_latency_seconds", "summary", "Time from starting a send until the wave is on air.",
+               histogram.percentile(0.5) / 1e9, '{quantile="0.5"}')
+        metric("pipyir_send_latency_seconds", None, None, histogram.percentile(0.99) / 1e9, '{quantile="0.99"}')
+        metric("pipyir_send_latency_seconds_sum", None, None, histogram.total / 1e9)
+        metric("pipyir_send_latency_seconds_count", None, None, histogram.count)
+
+        if self.sender is not None:
+            metric("pipyir_wave_cache_waves", "gauge", "Waves held by the wave cache.", len(self.sender.wave_cache))
+        scheduler = self.scheduler
+        if scheduler is not None:
+            metric("pipyir_queue_depth", "gauge", "Commands waiting in the transmit scheduler.", scheduler.queue_depth)
+            for attribute, (name, help_text) in SCHEDULER_METRICS.items():
+                metric(name, "counter", help_text, getattr(scheduler, attribute))
+        return "\n".join(lines) + "\n"
+
+    def start(self):
+        """
+        Starts serving on a background thread, enabling the instrumentation the metrics are read from.
+        """
+        if self._thread is not None:
+            return
+        instrumentation.enabled = True
+
+        def serve():
+            _lower_thread_priority()
+            self.server.serve_forever()
+
+        self._thread = threading.Thread(target=serve, name="pipyir-metrics", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread = None
+        self.server.server_close()
@@ -0,0 +1,114 @@
+"""
+This module provides StageProfiler, an aggregator for IRSender's profiling hooks.
+
+IRSender.add_profile_hook() registers a callable that is given the duration of every stage of a send, so a late
+cue can be traced to the stage it lost its time in. The stages, in the order a send goes through them:
+    run_lengths     converting a bit list to run lengths (send_bits_command only)
+    pulses          building the pulse data (or wave chain) of a command that was not built before
+    upload          wave_add_new and the pulse data upload to pigpiod
+    create          wave_create
+    send            wave_send_once, wave_send_repeat or wave_chain
+    wait            blocking until the transmission has finished
+    delete          wave_delete, of uncached waves and of waves evicted from the wave cache
+Each call is tagged with the command's name (the effect name, if known) and its pulse count.
+
+StageProfiler keeps a latency histogram per stage and flags outliers: samples that took more than
+PROFILE_OUTLIER_FACTOR times the usual time of the same stage for the same command. For example:
+    profiler = StageProfiler()
+    ir_sender.add_profile_hook(profiler)
+    ...
+    profiler.print_report()
+"""
+
+import sys
+from collections import deque
+
+import pipyir.config as cfg  # Import configuration settings
+from pipyir.instrument import Histogram
+
+# Stages of a send, in the order the report lists them
+PROFILE_STAGES = ("run_lengths", "pulses", "upload", "create", "send", "wait", "delete")
+
+# Samples of a stage and command needed before a slower one can be flagged as an outlier
+OUTLIER_MIN_SAMPLES = 5
+
+class StageProfiler:
+    """
+    Profiling hook collecting a per-stage breakdown of IRSender sends.
+    """
+    def __init__(self, outlier_factor=None, outlier_min_us=None, max_outliers=50):
+        """
+        :param outlier_factor: How many times its usual duration a sample must take to be an outlier,
+                               defaults to PROFILE_OUTLIER_FACTOR
+        :param outlier_min_us: Minimum excess over the usual duration of an outlier (in microseconds),
+                               defaults to PROFILE_OUTLIER_MIN_US
+        :param max_outliers: Number of recent outliers kept
+        """
+        self.outlier_factor = cfg.PROFILE_OUTLIER_FACTOR if outlier_factor is None else outlier_factor
+        self.outlier_min_ns = int((cfg.PROFILE_OUTLIER_MIN_US if outlier_min_us is None else outlier_min_us) * 1e3)
+        self.stages = {}  # stage -> Histogram
+        self.outlier_counts = {}  # stage -> number of outliers
+        self.outliers = deque(maxlen=max_outliers)  # (stage, name, pulse count, duration ns, usual ns)
+        self._usual = {}  # (stage, name) -> [sample count, total ns]
+
+    def __call__(self, stage, duration_ns, name, pulse_count):
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = Histogram()
+            self.outlier_counts[stage] = 0
+        histogram.add(duration_ns)
+
+        usual = self._usual.get((stage, name))
+        if usual is None:
+            self._usual[(stage, name)] = [1, duration_ns]
+            return
+        count, total = usual
+        if count >= OUTLIER_MIN_SAMPLES:
+            mean = total // count
+            if duration_ns > mean * self.outlier_factor and duration_ns - mean >= self.outlier_min_ns:
+                self.outlier_counts[stage] += 1
+                self.outliers.append((stage, name, pulse_count, duration_ns, mean))
+                # Outliers are left out of the usual duration, so a burst of them keeps being flagged
+                return
+        usual[0] = count + 1
+        usual[1] = total + duration_ns
+
+    def reset(self):
+        self.stages.clear()
+        self.outlier_counts.clear()
+        self.outliers.clear()
+        self._usual.clear()
+
+    def report(self, outliers=10):
+        """
+        Formats the time spent per stage and the most recent outliers.
+
+        :param outliers: Number of recent outliers to list
+        :return: Report text
+        """
+        if not self.stages:
+            return "No stages profiled."
+        grand_total = sum(histogram.total for histogram in self.stages.values()) or 1
+        lines = [f"{'stage':12} {'count':>8} {'total ms':>10} {'share':>7} {'mean us':>10} {'p50 us':>10} "
+                 f"{'p99 us':>10} {'max us':>10} {'outliers':>9}"]
+        order = {stage: index for index, stage in enumerate(PROFILE_STAGES)}
+        for stage in sorted(self.stages, key=lambda stage: order.get(stage, len(order))):
+            histogram = self.stages[stage]
+            lines.append(f"{stage:12} {histogram.count:8} {histogram.total / 1e6:10.3f} "
+                         f"{histogram.total / grand_total:7.1%} {histogram.mean / 1e3:10.1f} "
+                         f"{histogram.percentile(0.5) / 1e3:10.1f} {histogram.percentile(0.99) / 1e3:10.1f} "
+                         f"{histogram.max / 1e3:10.1f} {self.outlier_counts[stage]:9}")
+        recent = list(self.outliers)[-outliers:] if outliers else []
+        if recent:
+            lines.append("Recent outliers:")
+            for stage, name, pulse_count, duration_ns, usual_ns in recent:
+                lines.append(f"  {stage:12} {duration_ns / 1e3:10.1f} us (usually {usual_ns / 1e3:.1f} us) "
+                             f"{name if name is not None else '?'}"
+                             f"{f', {pulse_count} pulses' if pulse_count is not None else ''}")
+        return "\n".join(lines)
+
+    def print_report(self, stream=None):
+        """
+        :param stream: Stream to print to, defaults to stdout
+        """
+        print(self.report(), file=stream or sys.stdout)
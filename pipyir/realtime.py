@@ -0,0 +1,223 @@
+"""
+This module provides an opt-in real-time mode for the thread that runs IRSender, against the timing outliers
+caused by the kernel scheduler preempting it and by Python's garbage collector:
+- the thread is pinned to REALTIME_CPUS, ideally cores kept free of other tasks (e.g. isolcpus=3 on the kernel
+  command line in /boot/cmdline.txt)
+- the thread is switched to the SCHED_FIFO real-time policy, so ordinary processes cannot preempt it
+- the process memory is locked with mlockall, so no page fault stalls a send
+- a full collection is run and everything that exists (the compiled effect library, cached pulse data) is
+  frozen with gc.freeze(), then the garbage collector is disabled until the mode is left, when the deferred
+  collection runs; a thread that stays in the mode calls collect() when it is idle instead (TransmitScheduler
+  does whenever its queue empties), so garbage does not pile up in locked memory
+Affinity and scheduling policy apply to the calling thread only, so enter the mode on the thread that sends
+(TransmitScheduler and the cluster agent do this when given a RealtimeMode). Each step needs privileges (root,
+or CAP_SYS_NICE and CAP_IPC_LOCK); a step that fails is reported rather than raised, so the mode degrades to
+whatever the system allows. For example:
+    with RealtimeMode() as realtime:
+        timeline.play(ir_sender)
+    print(realtime.report())
+
+measure_jitter() reports the achieved wake-up timing. To compare it with and without the mode:
+    sudo python -m pipyir.realtime
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import gc
+import os
+import time
+
+import pipyir.config as cfg  # Import configuration settings
+from pipyir.instrument import Histogram
+from pipyir.timeline import sleep_until
+
+# mlockall flags: lock the pages mapped now, and the pages mapped later
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+
+def _libc():
+    return ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+class RealtimeMode:
+    """
+    Context manager switching the calling thread to real-time operation, and back on exit.
+    Can be entered again after it has been left.
+    """
+    def __init__(self, cpus=None, priority=None, lock_memory=None, disable_gc=True):
+        """
+        :param cpus: CPUs to pin the thread to, defaults to REALTIME_CPUS (None leaves the affinity as is)
+        :param priority: SCHED_FIFO priority (1 to 99), defaults to REALTIME_PRIORITY (0 keeps the policy)
+        :param lock_memory: Whether to lock the process memory, defaults to REALTIME_LOCK_MEMORY
+        :param disable_gc: Whether to freeze existing objects and disable the garbage collector while active
+        """
+        self.cpus = cfg.REALTIME_CPUS if cpus is None else cpus
+        self.priority = cfg.REALTIME_PRIORITY if priority is None else priority
+        self.lock_memory = cfg.REALTIME_LOCK_MEMORY if lock_memory is None else lock_memory
+        self.disable_gc = disable_gc
+        self.applied = []  # Steps that succeeded, as text
+        self.failed = []  # Steps that failed, as text
+        self.active = False
+        self._previous = {}
+
+    def __enter__(self):
+        self.enter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.exit()
+
+    def _step(self, description, action):
+        try:
+            action()
+        except (AttributeError, OSError) as exc:
+            self.failed.append(f"{description}: {exc}")
+            return False
+        self.applied.append(description)
+        return True
+
+    def enter(self):
+        """
+        Applies every configured step to the calling thread.
+        """
+        if self.active:
+            return
+        self.applied = []
+        self.failed = []
+        self._previous = {}
+        if self.cpus:
+            cpus = set(self.cpus)
+            previous = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+            if self._step(f"pinned to CPU {', '.join(str(cpu) for cpu in sorted(cpus))}",
+                          lambda: os.sched_setaffinity(0, cpus)):
+                self._previous["affinity"] = previous
+        if self.priority:
+            policy = os.sched_getscheduler(0) if hasattr(os, "sched_getscheduler") else None
+            param = os.sched_getparam(0) if policy is not None else None
+            if self._step(f"SCHED_FIFO priority {self.priority}",
+                          lambda: os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.priority))):
+                self._previous["scheduler"] = (policy, param)
+        if self.lock_memory:
+            if self._step("memory locked", lambda: self._mlockall(MCL_CURRENT | MCL_FUTURE)):
+                self._previous["mlock"] = True
+        if self.disable_gc:
+            self._previous["gc"] = gc.isenabled()
+            gc.collect()
+            gc.freeze()
+            gc.disable()
+            self.applied.append("garbage collector frozen and disabled")
+        self.active = True
+        if cfg.DEBUG:
+            print(self.report())
+
+    def exit(self):
+        """
+        Restores the thread's previous affinity and scheduling policy, unlocks memory and runs the deferred
+        garbage collection.
+        """
+        if not self.active:
+            return
+        self.active = False
+        if "gc" in self._previous:
+            # Frozen objects stay frozen: they are long lived, and later shows need not scan them again
+            if self._previous["gc"]:
+                gc.enable()
+            gc.collect()
+        if self._previous.get("mlock"):
+            try:
+                _libc().munlockall()
+            except OSError:
+                pass
+        if "scheduler" in self._previous:
+            policy, param = self._previous["scheduler"]
+            try:
+                os.sched_setscheduler(0, policy, param)
+            except OSError:
+                pass
+        if self._previous.get("affinity") is not None:
+            try:
+                os.sched_setaffinity(0, self._previous["affinity"])
+            except OSError:
+                pass
+
+    def collect(self):
+        """
+        Runs the garbage collection deferred while the mode is active, for a thread that stays in the mode
+        between bursts of sends. Like the collector itself, it only collects generations past their threshold.
+
+        :return: Number of unreachable objects found
+        """
+        if not self.active or "gc" not in self._previous:
+            return 0
+        counts = gc.get_count()
+        thresholds = gc.get_threshold()
+        generation = -1
+        for i, (count, threshold) in enumerate(zip(counts, thresholds)):
+            if threshold and count >= threshold:
+                generation = i
+        return gc.collect(generation) if generation >= 0 else 0
+
+    @staticmethod
+    def _mlockall(flags):
+        if _libc().mlockall(flags) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    def report(self):
+        """
+        :return: Text listing the steps that were applied and those that failed
+        """
+        lines = [f"Real-time mode: {', '.join(self.applied) if self.applied else 'nothing applied'}"]
+        lines += [f"  failed: {failure}" for failure in self.failed]
+        return "\n".join(lines)
+
+def measure_jitter(duration=1.0, interval=0.001, spin=None):
+    """
+    Measures how late the calling thread wakes up for deadlines, the way a Timeline waits for its cues.
+
+    :param duration: Seconds to measure for
+    :param interval: Seconds between deadlines
+    :param spin: Seconds spent spinning before each deadline, defaults to TIMELINE_SPIN
+    :return: Dict with the number of wake-ups and the p50, p99 and maximum lateness (in microseconds)
+    """
+    histogram = Histogram()
+    start = time.monotonic()
+    deadline = start + interval
+    end = start + duration
+    while deadline <= end:
+        sleep_until(deadline, spin)
+        histogram.add(int((time.monotonic() - deadline) * 1e9))
+        deadline += interval
+    return {
+        "wakeups": histogram.count,
+        "p50_us": histogram.percentile(0.5) / 1e3,
+        "p99_us": histogram.percentile(0.99) / 1e3,
+        "max_us": histogram.max / 1e3,
+    }
+
+def format_jitter(label, jitter):
+    return (f"{label:10} {jitter['wakeups']:8} wake-ups, p50 {jitter['p50_us']:8.1f} us, "
+            f"p99 {jitter['p99_us']:8.1f} us, max {jitter['max_us']:8.1f} us")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure scheduling jitter with and without real-time mode.")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds to measure each mode for.")
+    parser.add_argument("--interval", type=float, default=0.001, help="Seconds between deadlines.")
+    parser.add_argument("--spin", type=float, default=0.0,
+                        help="Seconds to spin before each deadline (0 measures plain sleeps).")
+    args = parser.parse_args()
+
+    # Imported for its side effect: compiling the effect library first, like a transmitter does, so real-time
+    # mode freezes it
+    import pipyir.effect_library  # noqa: F401
+
+    print(format_jitter("normal", measure_jitter(args.duration, args.interval, args.spin)))
+    realtime = RealtimeMode()
+    with realtime:
+        jitter = measure_jitter(args.duration, args.interval, args.spin)
+    if not cfg.DEBUG:
+        print(realtime.report())
+    print(format_jitter("real-time", jitter))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+This module provides the TransmitScheduler class, a dedicated transmitter thread around IRSender.
+Commands are submitted with a priority; the thread always sends the most urgent pending command next.
+Duplicate pending commands from separate submissions are coalesced, and an urgent command can cancel everything
+queued at a lower priority (e.g. background loops when a blackout cue arrives).
+Commands submitted in a group are superseded by the group's next submission: when a controller sends faster
+than IR airtime allows, the stale commands still waiting are cancelled and only the latest ones are sent.
+
+Submission does not take a lock: submitters append to a deque, which is atomic in CPython, and wake the
+thread with an Event. Only the transmitter thread touches the priority heap and the IRSender.
+"""
+
+import heapq
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+import pipyir.config as cfg  # Import configuration settings
+
+# Priorities, lower numbers are sent first
+PRIORITY_URGENT = 0
+PRIORITY_NORMAL = 10
+PRIORITY_BACKGROUND = 20
+
+class TransmitRequest:
+    """
+    A command waiting in the TransmitScheduler. The future resolves to the Transmission once it is sent,
+    or is cancelled if the request is coalesced or preempted.
+    """
+    __slots__ = ("command", "priority", "key", "future", "preempt", "cancelled", "group", "batch")
+
+    def __init__(self, command, priority, key, preempt, group=None, batch=None):
+        self.command = command
+        self.priority = priority
+        self.key = key
+        self.future = Future()
+        self.preempt = preempt
+        self.cancelled = False
+        self.group = group
+        self.batch = batch
+
+def command_key(command):
+    """
+    Returns the key used to detect duplicate commands.
+
+    :param command: CompiledEffect or list of bits (0s and 1s)
+    """
+    if hasattr(command, "run_lengths"):
+        return command.run_lengths
+    return tuple(command)
+
+class TransmitScheduler:
+    def __init__(self, sender, max_pending=None, realtime=None):
+        """
+        :param sender: IRSender owned by the transmitter thread from now on
+        :param max_pending: Maximum number of pending commands (the lowest priority ones are dropped first),
+            defaults to TX_QUEUE_SIZE
+        :param realtime: RealtimeMode (see pipyir/realtime.py) the transmitter thread runs in, if any; its deferred
+            garbage collection runs whenever the queue empties
+        """
+        self.sender = sender
+        self.realtime = realtime
+        self.max_pending = cfg.TX_QUEUE_SIZE if max_pending is None else max_pending
+        self._inbox = deque()
+        self._wake = threading.Event()
+        self._heap = []  # (priority, sequence, TransmitRequest)
+        self._pending = {}  # key -> newest pending TransmitRequest, used for coalescing
+        self._sequence = itertools.count()
+        self._batches = itertools.count()
+        self._running = False
+        self._thread = None
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.preempted = 0
+        self.superseded = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    @property
+    def queue_depth(self):
+        return len(self._pending) + len(self._inbox)
+
+    def start(self):
+        """
+        Starts the transmitter thread.
+        """
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="pipyir-scheduler", daemon=True)
+        self._thread.start()
+
+    def submit(self, command, priority=PRIORITY_NORMAL, preempt=False):
+        """
+        Queues a command for transmission. Safe to call from any thread.
+
+        :param command: CompiledEffect or list of bits (0s and 1s)
+        :param priority: Priority of the command, lower numbers are sent first
+        :param preempt: Whether to cancel all pending commands with a lower priority (higher number)
+        :return: concurrent.futures.Future resolving to the Transmission
+        """
+        request = TransmitRequest(command, priority, command_key(command), preempt)
+        self._inbox.append(request)
+        self._wake.set()
+        return request.future
+
+    def submit_batch(self, commands, priority=PRIORITY_NORMAL, preempt=False, group=None):
+        """
+        Queues several commands, to be sent in order. Safe to call from any thread.
+
+        :param commands: List of CompiledEffects or lists of bits (0s and 1s)
+        :param priority: Priority of the commands, lower numbers are sent first
+        :param preempt: Whether to cancel all pending commands with a lower priority (higher number)
+        :param group: Any hashable; commands of the group from earlier submissions that are still pending are
+            cancelled, so only the latest batch is sent
+        :return: List of concurrent.futures.Future resolving to the Transmissions
+        """
+        batch = next(self._batches)
+        requests = [TransmitRequest(command, priority, command_key(command), preempt and i == 0, group, batch)
+                    for i, command in enumerate(commands)]
+        self._inbox.extend(requests)
+        self._wake.set()
+        return [request.future for request in requests]
+
+    def stop(self, cleanup=True):
+        """
+        Sends everything still pending and stops the transmitter thread.
+
+        :param cleanup: Whether to call IRSender.cleanup()
+        """
+        if self._thread is not None:
+            self._running = False
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        if cleanup:
+            self.sender.cleanup()
+
+    def _cancel(self, request, replacement=None):
+        """
+        Removes a pending request. Its future is cancelled, or follows the replacement request if given.
+        """
+        request.cancelled = True
+        if self._pending.get(request.key) is request:
+            del self._pending[request.key]
+        if replacement is None:
+            request.future.cancel()
+        else:
+            replacement.future.add_done_callback(lambda f, r=request: _chain_future(f, r.future))
+
+    def _drain_inbox(self):
+        """
+        Moves submitted requests from the inbox onto the heap, coalescing and preempting as needed.
+        """
+        while self._inbox:
+            request = self._inbox.popleft()
+            if request.future.cancelled():
+                continue
+
+            if request.preempt:
+                for _, _, queued in self._heap:
+                    if not queued.cancelled and queued.priority > request.priority:
+                        self._cancel(queued)
+                        self.preempted += 1
+
+            if request.group is not None:
+                for _, _, queued in self._heap:
+                    if not queued.cancelled and queued.group == request.group and queued.batch != request.batch:
+                        self._cancel(queued)
+                        self.superseded += 1
+
+            # Repeats within one batch are part of its sequence and are all sent; only a request from a separate
+            # submission is coalesced, with the newest pending request of the same command
+            duplicate = self._pending.get(request.key)
+            if duplicate is not None and (duplicate.batch is None or duplicate.batch != request.batch):
+                self.coalesced += 1
+                if duplicate.priority <= request.priority:
+                    # Already queued at the same or a higher priority; share its result
+                    self._cancel(request, duplicate)
+                    continue
+                # The new request is more urgent and takes the place of the queued one
+                self._cancel(duplicate, request)
+
+            self._pending[request.key] = request
+            heapq.heappush(self._heap, (request.priority, next(self._sequence), request))
+
+            if len(self._pending) > self.max_pending:
+                self._drop_lowest()
+
+    def _drop_lowest(self):
+        lowest = max((entry for entry in self._heap if not entry[2].cancelled), key=lambda e: (e[0], e[1]))
+        self._cancel(lowest[2])
+        self.dropped += 1
+
+    def _next_request(self):
+        while self._heap:
+            _, _, request = heapq.heappop(self._heap)
+            if request.cancelled:
+                continue
+            if self._pending.get(request.key) is request:
+                del self._pending[request.key]
+            if request.future.set_running_or_notify_cancel():
+                return request
+        return None
+
+    def _run(self):
+        if self.realtime is None:
+            self._serve()
+            return
+        with self.realtime:
+            self._serve()
+
+    def _serve(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            self._drain_inbox()
+            request = self._next_request()
+            while request is not None:
+                try:
+                    if hasattr(request.command, "run_lengths"):
+                        transmission = self.sender.send_effect(request.command)
+                    else:
+                        transmission = self.sender.send_bits_command(request.command)
+                except Exception as exc:
+                    request.future.set_exception(exc)
+                else:
+                    request.future.set_result(transmission)
+                    self.sent += 1
+                # Pick up anything submitted while this command was on air before choosing the next one
+                self._drain_inbox()
+                request = self._next_request()
+            if self.realtime is not None:
+                # The queue is empty: run the garbage collection real-time mode deferred, between bursts
+                self.realtime.collect()
+            if not self._running and not self._inbox:
+                return
+
+def _chain_future(source, target):
+    """
+    Copies the outcome of one future to another.
+    """
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
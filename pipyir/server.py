@@ -0,0 +1,253 @@
+"""
+This module provides a network control server, so a lighting desk or a DMX/OSC bridge can trigger effects.
+
+Commands arrive in frames: one UDP datagram, or one line over TCP or a Unix socket. A frame holds one or more
+commands separated by ";" (or newlines in a datagram):
+    RED                     base color or special effect
+    RED FADE_1              effect with a tail code
+    #42                     compiled effect ID (see --list-ids), skipping the name lookup
+    !BLACKOUT               "!" sends the command urgently, cancelling everything queued at normal priority
+The commands of a frame are sent in order through a single TransmitScheduler, its urgent ones first as a batch
+of their own. The commands of a frame supersede those of earlier frames that are still waiting (urgent ones
+those of earlier urgent ones), so when the desk sends faster than IR airtime allows, stale commands are
+dropped rather than queued up behind each other.
+
+A frame consisting of STATS is answered with the counters as JSON (queue depth, drops, ...).
+
+Run the server with the ports from 'pipyir/config.py':
+    python -m pipyir.server
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import threading
+
+import pipyir.config as cfg  # Import configuration settings
+from pipyir.effect_library import effects
+from pipyir.ir import IRSender
+from pipyir.metrics import MetricsServer
+from pipyir.profiling import StageProfiler
+from pipyir.realtime import RealtimeMode
+from pipyir.scheduler import PRIORITY_NORMAL, PRIORITY_URGENT, TransmitScheduler
+
+# Scheduler groups of commands received from the network, normal and urgent, see TransmitScheduler.submit_batch
+CONTROL_GROUP = "control"
+CONTROL_URGENT_GROUP = "control-urgent"
+
+class _UDPServer(socketserver.UDPServer):
+    # Datagrams are handled on the listener thread, without starting a thread per frame
+    allow_reuse_address = True
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+class _UnixStreamServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+def effect_ids(library):
+    """
+    Numbers every effect of a library, ordered by full name, so IDs stay the same as long as the
+    definitions do.
+
+    :param library: EffectLibrary
+    :return: List of CompiledEffects, indexed by ID
+    """
+    return sorted(library.values(), key=lambda effect: effect.full_name)
+
+def parse_command(text, library, ids):
+    """
+    Parses one command of a frame.
+
+    :param text: Command text, e.g. "RED FADE_1", "#42" or "!BLACKOUT"
+    :param library: EffectLibrary to look names up in
+    :param ids: List of CompiledEffects indexed by compiled ID
+    :return: Tuple of (CompiledEffect, urgent)
+    :raises KeyError: If the effect, tail code or ID is unknown
+    :raises ValueError: If the command is malformed
+    """
+    text = text.strip()
+    urgent = text.startswith("!")
+    if urgent:
+        text = text[1:].lstrip()
+    if text.startswith("#"):
+        try:
+            return ids[int(text[1:])], urgent
+        except (ValueError, IndexError):
+            raise KeyError(f"Unknown effect ID: {text}") from None
+    parts = text.split()
+    if not 1 <= len(parts) <= 2:
+        raise ValueError(f"Malformed command: {text!r}")
+    return library.compose(*parts), urgent
+
+class ControlServer:
+    """
+    Feeds commands received over UDP, TCP and/or a Unix socket into a TransmitScheduler.
+    """
+    def __init__(self, scheduler, library=None, host=None, udp_port=None, tcp_port=None, unix_path=None):
+        """
+        :param scheduler: Started TransmitScheduler to submit commands to
+        :param library: EffectLibrary, defaults to the shipped effects
+        :param host: Address to listen on, defaults to CONTROL_HOST
+        :param udp_port: UDP port (None for no UDP listener, 0 picks a free port)
+        :param tcp_port: TCP port (None for no TCP listener, 0 picks a free port)
+        :param unix_path: Unix stream socket path (None for no Unix socket)
+        """
+        self.scheduler = scheduler
+        self.library = library if library is not None else effects
+        self.ids = effect_ids(self.library)
+        host = cfg.CONTROL_HOST if host is None else host
+        self.frames = 0
+        self.commands = 0
+        self.invalid = 0
+        self._lock = threading.Lock()  # Serialises frames from different listener threads
+        self._servers = []
+        control = self
+
+        class DatagramHandler(socketserver.BaseRequestHandler):
+            def handle(self):
+                data, sock = self.request
+                reply = control.handle_frame(data.decode("utf-8", "replace").replace("\n", ";"))
+                if reply is not None:
+                    sock.sendto(reply.encode("utf-8"), self.client_address)
+
+        class StreamHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    reply = control.handle_frame(line.decode("utf-8", "replace"))
+                    if reply is not None:
+                        self.wfile.write(reply.encode("utf-8") + b"\n")
+
+        if udp_port is not None:
+            self._servers.append(_UDPServer((host, udp_port), DatagramHandler))
+        if tcp_port is not None:
+            self._servers.append(_TCPServer((host, tcp_port), StreamHandler))
+        if unix_path is not None:
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)
+            self._servers.append(_UnixStreamServer(unix_path, StreamHandler))
+
+    @property
+    def addresses(self):
+        return [server.server_address for server in self._servers]
+
+    def handle_frame(self, text):
+        """
+        Parses a frame and submits its commands.
+
+        :param text: Frame text
+        :return: Reply text, or None if the frame needs no reply
+        """
+        text = text.strip()
+        if text.upper() == "STATS":
+            return json.dumps(self.stats())
+        commands = []
+        urgent = []
+        invalid = 0
+        for part in text.split(";"):
+            if not part.strip():
+                continue
+            try:
+                effect, part_urgent = parse_command(part, self.library, self.ids)
+            except (KeyError, ValueError) as exc:
+                invalid += 1
+                if cfg.DEBUG:
+                    print(f"Ignoring command: {exc}")
+                continue
+            (urgent if part_urgent else commands).append(effect)
+        with self._lock:
+            self.frames += 1
+            self.commands += len(urgent) + len(commands)
+            self.invalid += invalid
+            if urgent:
+                # Submitted first, so the preemption cancels what was queued before this frame but not its other
+                # commands
+                self.scheduler.submit_batch(urgent, PRIORITY_URGENT, preempt=True, group=CONTROL_URGENT_GROUP)
+            if commands:
+                self.scheduler.submit_batch(commands, PRIORITY_NORMAL, group=CONTROL_GROUP)
+        return None
+
+    def stats(self):
+        """
+        :return: Dict of counters
+        """
+        scheduler = self.scheduler
+        return {
+            "frames": self.frames,
+            "commands": self.commands,
+            "invalid": self.invalid,
+            "queue_depth": scheduler.queue_depth,
+            "sent": scheduler.sent,
+            "coalesced": scheduler.coalesced,
+            "superseded": scheduler.superseded,
+            "preempted": scheduler.preempted,
+            "dropped": scheduler.dropped,
+        }
+
+    def start(self):
+        """
+        Starts a thread per listener.
+        """
+        for server in self._servers:
+            threading.Thread(target=server.serve_forever, name="pipyir-control", daemon=True).start()
+
+    def close(self):
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+            if isinstance(server, _UnixStreamServer) and os.path.exists(server.server_address):
+                os.unlink(server.server_address)
+
+def main():
+    parser = argparse.ArgumentParser(description="Send pipyir effects on commands received over the network.")
+    parser.add_argument("--host", default=cfg.CONTROL_HOST)
+    parser.add_argument("--udp", type=int, default=cfg.CONTROL_UDP_PORT, help="UDP port (-1 disables UDP).")
+    parser.add_argument("--tcp", type=int, default=cfg.CONTROL_TCP_PORT, help="TCP port (-1 disables TCP).")
+    parser.add_argument("--unix", default=cfg.CONTROL_UNIX_SOCKET, help="Unix socket path.")
+    parser.add_argument("--list-ids", action="store_true", help="List the compiled effect IDs and exit.")
+    parser.add_argument("--metrics-port", type=int, default=cfg.METRICS_PORT,
+                        help="Port of the Prometheus metrics endpoint (-1 disables it).")
+    parser.add_argument("--realtime", action="store_true",
+                        help="Run the transmitter thread in real-time mode (see pipyir/realtime.py), needs root.")
+    parser.add_argument("--profile", action="store_true", help="Print the time spent per send stage on exit.")
+    args = parser.parse_args()
+
+    if args.list_ids:
+        for effect_id, effect in enumerate(effect_ids(effects)):
+            print(f"#{effect_id} {effect.full_name}")
+        return
+
+    ir_sender = IRSender()
+    profiler = None
+    if args.profile:
+        profiler = StageProfiler()
+        ir_sender.add_profile_hook(profiler)
+    scheduler = TransmitScheduler(ir_sender, realtime=RealtimeMode() if args.realtime else None)
+    scheduler.start()
+    server = ControlServer(scheduler, host=args.host,
+                           udp_port=args.udp if args.udp is not None and args.udp >= 0 else None,
+                           tcp_port=args.tcp if args.tcp is not None and args.tcp >= 0 else None,
+                           unix_path=args.unix)
+    server.start()
+    metrics = None
+    if args.metrics_port is not None and args.metrics_port >= 0:
+        metrics = MetricsServer(scheduler, port=args.metrics_port)
+        metrics.start()
+    print(f"Listening on {', '.join(str(address) for address in server.addresses)}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if metrics is not None:
+            metrics.close()
+        server.close()
+        scheduler.stop()
+        print(json.dumps(server.stats()))
+        if profiler is not None:
+            profiler.print_report()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+This module provides the Timeline class for playing a show of effects at absolute cue times.
+Every cue is scheduled against one time.monotonic() start point rather than sleeping for each duration in
+turn, so transmit time and sleep overshoot never accumulate into drift over a long show.
+A cue's time is the moment its code should finish transmitting (when the bracelets react), so the send is
+started one airtime earlier. Each cue's lateness is recorded so timing can be verified after the show.
+"""
+
+import time
+
+import pipyir.config as cfg  # Import configuration settings
+from pipyir.ir import run_lengths_airtime_us
+
+class Cue:
+    __slots__ = ("time", "effect", "label")
+
+    def __init__(self, time_s, effect, label=None):
+        """
+        :param time_s: Seconds from the start of the show at which the effect should have been received
+        :param effect: CompiledEffect to send, or None for a cue that sends nothing
+        :param label: Name shown in reports, defaults to the effect name
+        """
+        self.time = time_s
+        self.effect = effect
+        self.label = label if label is not None else (effect.full_name if effect is not None else "-")
+
+    def __repr__(self):
+        return f"Cue({self.time:.3f}, {self.label!r})"
+
+class CueResult:
+    __slots__ = ("cue", "target", "actual")
+
+    def __init__(self, cue, target, actual):
+        """
+        :param cue: The Cue that was played
+        :param target: time.monotonic() at which the send was due to start
+        :param actual: time.monotonic() at which the send started
+        """
+        self.cue = cue
+        self.target = target
+        self.actual = actual
+
+    @property
+    def lateness(self):
+        """
+        Seconds the send started after its target (negative if early).
+        """
+        return self.actual - self.target
+
+def effect_airtime(effect):
+    """
+    :param effect: CompiledEffect
+    :return: Airtime of the effect (in seconds)
+    """
+    return run_lengths_airtime_us(effect.run_lengths, cfg.PULSE_LENGTH) / 1e6
+
+def sleep_until(deadline, spin=None):
+    """
+    Sleeps until a time.monotonic() deadline. The last part is spent spinning, since a plain sleep can
+    overshoot by around a millisecond on a loaded Pi.
+
+    :param deadline: time.monotonic() value to wake up at
+    :param spin: Seconds before the deadline to stop sleeping and spin, defaults to TIMELINE_SPIN
+    """
+    if spin is None:
+        spin = cfg.TIMELINE_SPIN
+    remaining = deadline - time.monotonic()
+    if remaining > spin:
+        time.sleep(remaining - spin)
+    while time.monotonic() < deadline:
+        pass
+
+class Timeline:
+    def __init__(self, cues, compensate_airtime=True):
+        """
+        :param cues: Iterable of Cue objects, in any order
+        :param compensate_airtime: Whether to start each send one airtime before its cue time
+        """
+        self.cues = sorted(cues, key=lambda cue: cue.time)
+        self.compensate_airtime = compensate_airtime
+        self.results = []
+
+    @classmethod
+    def from_effects_to_show(cls, effects_to_show, library, **kwargs):
+        """
+        Builds a timeline from an EFFECTS_TO_SHOW list as used by the demo scripts, where each entry's
+        "duration" is the time until the next entry.
+
+        :param effects_to_show: List of dicts with "main_effect", optional "tail_code" and "duration"
+        :param library: EffectLibrary to look the effects up in
+        :return: Timeline
+        """
+        cues = []
+        cue_time = 0.0
+        for entry in effects_to_show:
+            main_effect = entry.get("main_effect")
+            if main_effect:
+                cues.append(Cue(cue_time, library.get(main_effect, entry.get("tail_code"))))
+            cue_time += entry["duration"]
+        # Keep the show running until the last entry's duration is over
+        cues.append(Cue(cue_time, None, "END"))
+        return cls(cues, **kwargs)
+
+    @property
+    def duration(self):
+        return self.cues[-1].time if self.cues else 0.0
+
+    @property
+    def lead_in(self):
+        """
+        Seconds before show time 0 at which the first send starts (the airtime of any cue at time 0).
+        """
+        return max(0.0, -min((self._offset(cue) for cue in self.cues), default=0.0))
+
+    def _offset(self, cue):
+        if self.compensate_airtime and cue.effect is not None:
+            return cue.time - effect_airtime(cue.effect)
+        return cue.time
+
+    def play(self, sender, start=None, clock_offset=None):
+        """
+        Plays the cues through an IRSender, blocking until the last one has been transmitted.
+        The waves of the show are preloaded first, as far as the wave cache allows.
+
+        :param sender: IRSender to send with
+        :param start: time.monotonic() value of show time 0, defaults to as soon as the first send can start
+        :param clock_offset: Function returning seconds to add to start, called again before every cue, e.g. to
+                             follow a reference clock on another machine while playing
+        :return: List of CueResult, one per cue
+        """
+        # Upload the waves before the show starts, first cues last so the wave cache keeps them longest
+        effects = list({cue.effect.run_lengths: cue.effect for cue in self.cues if cue.effect is not None}.values())
+        for effect in reversed(effects):
+            sender.preload(effect.run_lengths)
+
+        if start is None:
+            start = time.monotonic() + self.lead_in
+
+        self.results = []
+        transmission = None
+        for cue in self.cues:
+            target = start + self._offset(cue)
+            if clock_offset is not None:
+                target += clock_offset()
+            sleep_until(target)
+            actual = time.monotonic()
+            if cue.effect is not None:
+                sent = sender.send_effect(cue.effect, wait=False)
+                if sent is not None:
+                    # Includes any wait for the previous cue's code to finish
+                    transmission = sent
+                    actual = sent.start
+            self.results.append(CueResult(cue, target, actual))
+        if transmission is not None:
+            transmission.wait()
+
+        if cfg.DEBUG:
+            print(self.report())
+        return self.results
+
+    def report(self):
+        """
+        Summarises the lateness of the last play.
+
+        :return: Report text
+        """
+        if not self.results:
+            return "No cues played."
+        worst = max(self.results, key=lambda result: abs(result.lateness))
+        mean = sum(result.lateness for result in self.results) / len(self.results)
+        return (f"Played {len(self.results)} cues, mean lateness {mean * 1e3:.3f} ms, "
+                f"worst {worst.lateness * 1e3:.3f} ms at {worst.cue!r}")
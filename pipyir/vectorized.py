@@ -0,0 +1,111 @@
+"""
+This module provides an optional NumPy-based wave encoder for bulk work, such as encoding every effect of a
+show at load time or generating many variants on the fly.
+encode_batch() turns a batch of run-length sequences into pulse on/off/delay arrays in one vectorized pass,
+producing the same pulses (and carrier timing) as run_lengths_to_pulses() in 'pipyir/ir.py' without creating a Python object per
+pulse. pack_pulses() lays the arrays out in the wire format pigpio's wave_add_generic sends to pigpiod:
+three unsigned 32 bit ints (gpio_on, gpio_off, delay) per pulse.
+
+NumPy is optional; HAVE_NUMPY tells whether it is installed (on Raspberry Pi OS: sudo apt-get install python3-numpy).
+"""
+
+try:
+    import numpy as np
+except ImportError:  # Only the vectorized encoder needs it
+    np = None
+
+from pipyir.backends import PULSE_STRUCT, Pulse
+
+HAVE_NUMPY = np is not None
+
+if HAVE_NUMPY:
+    PULSE_DTYPE = np.dtype([("gpio_on", "<u4"), ("gpio_off", "<u4"), ("delay", "<u4")])
+
+def _require_numpy():
+    if not HAVE_NUMPY:
+        raise RuntimeError("The vectorized encoder needs the numpy module (python3-numpy)")
+
+def encode_batch(run_lengths_list, gpio_mask, unit, carrier_freq):
+    """
+    Encodes several run-length sequences at once.
+
+    :param run_lengths_list: List of run-length sequences, each starting with a mark
+    :param gpio_mask: Bit mask of the GPIO pins driving the IR LED
+    :param unit: Base unit time for one bit (in microseconds)
+    :param carrier_freq: Carrier frequency (in Hz)
+    :return: Tuple of (pulses, offsets): a PULSE_DTYPE array with the pulses of every sequence back to back,
+             and an array of len(run_lengths_list) + 1 offsets, sequence i being pulses[offsets[i]:offsets[i + 1]]
+    """
+    _require_numpy()
+
+    def edge_us(edge):
+        # Vectorized carrier_edge_us
+        return ((edge * 1000000 + carrier_freq) // (2 * carrier_freq)).astype(np.int64)
+
+    run_counts = np.fromiter((len(run_lengths) for run_lengths in run_lengths_list), dtype=np.int64,
+                             count=len(run_lengths_list))
+    runs = np.fromiter((run for run_lengths in run_lengths_list for run in run_lengths), dtype=np.int64,
+                       count=int(run_counts.sum()))
+    # Position of each run within its own sequence, even positions are marks
+    run_starts = np.repeat(np.cumsum(run_counts) - run_counts, run_counts)
+    is_mark = (np.arange(len(runs)) - run_starts) % 2 == 0
+
+    # Same integer arithmetic as mark_timing, so both encoders give identical pulses
+    duration_us = np.rint(runs * float(unit)).astype(np.int64)
+    num_cycles = np.where(is_mark, (duration_us * carrier_freq // 1000000).astype(np.int64), 0)
+    remaining = duration_us - edge_us(2 * num_cycles)
+    remaining_on = np.maximum(0, np.minimum(remaining - 1, edge_us(2 * num_cycles + 1) - edge_us(2 * num_cycles)))
+    remaining_off = remaining - remaining_on
+    pulse_counts = np.where(is_mark, 2 * num_cycles + (remaining_on > 0) + (remaining_off > 0), 1)
+
+    # Expand every run into its pulses, pos being the pulse's index within its run
+    total = int(pulse_counts.sum())
+    run_of_pulse = np.repeat(np.arange(len(runs)), pulse_counts)
+    pos = np.arange(total) - np.repeat(np.cumsum(pulse_counts) - pulse_counts, pulse_counts)
+    mark = is_mark[run_of_pulse]
+    cycle = mark & (pos < 2 * num_cycles[run_of_pulse])
+    # The remainder's on pulse is left out when it would be empty
+    tail_on = mark & ~cycle & (pos == 2 * num_cycles[run_of_pulse]) & (remaining_on[run_of_pulse] > 0)
+    tail_off = mark & ~cycle & ~tail_on
+
+    pulses = np.zeros(total, dtype=PULSE_DTYPE)
+    pulses["gpio_on"][(cycle & (pos % 2 == 0)) | tail_on] = gpio_mask
+    pulses["gpio_off"][(cycle & (pos % 2 == 1)) | tail_off | ~mark] = gpio_mask
+    pulses["delay"] = np.select(
+        [cycle, tail_on, tail_off],
+        [edge_us(pos + 1) - edge_us(pos), remaining_on[run_of_pulse], remaining_off[run_of_pulse]],
+        duration_us[run_of_pulse])
+
+    sequence_of_run = np.repeat(np.arange(len(run_counts)), run_counts)
+    offsets = np.zeros(len(run_counts) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(sequence_of_run, weights=pulse_counts, minlength=len(run_counts)))
+    return pulses, offsets
+
+def pack_pulses(pulses):
+    """
+    :param pulses: PULSE_DTYPE array, e.g. a slice of the array returned by encode_batch
+    :return: The pulses in pigpio's wire format (bytes)
+    """
+    _require_numpy()
+    return np.ascontiguousarray(pulses, dtype=PULSE_DTYPE).tobytes()
+
+def encode_packed(run_lengths_list, gpio_mask, unit, carrier_freq):
+    """
+    Encodes several run-length sequences straight to pigpio's wire format.
+
+    :return: List of bytes, one per sequence
+    """
+    pulses, offsets = encode_batch(run_lengths_list, gpio_mask, unit, carrier_freq)
+    data = pack_pulses(pulses)
+    size = PULSE_STRUCT.size
+    return [data[start * size:end * size] for start, end in zip(offsets[:-1], offsets[1:])]
+
+def unpack_pulses(data):
+    """
+    Converts packed pulses back to Pulse objects, e.g. for backends that only offer wave_add_generic.
+    Does not need NumPy.
+
+    :param data: Pulses in pigpio's wire format (bytes-like)
+    :return: List of Pulse objects
+    """
+    return [Pulse(gpio_on, gpio_off, delay) for gpio_on, gpio_off, delay in PULSE_STRUCT.iter_unpack(data)]
@@ -0,0 +1,69 @@
+"""
+Tests for the transmit backends of 'pipyir/backends.py'.
+"""
+
+import socket
+import threading
+
+import pytest
+
+from pipyir.backends import (CMD_WVCRE, CMD_WVDEL, COMMAND_STRUCT, MAX_UNREAD_REPLIES, REPLY_STRUCT,
+                             PipelinedPigpioBackend)
+
+class FakePigpiod:
+    """
+    Socket stub answering pigpiod commands in order, with 0 (or a new wave ID for wave_create).
+    """
+    def __init__(self):
+        self.listener = socket.create_server(("127.0.0.1", 0))
+        self.port = self.listener.getsockname()[1]
+        self.commands = []  # (command, p1) in the order received
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        connection, _ = self.listener.accept()
+        reader = connection.makefile("rb")
+        waves = 0
+        while True:
+            header = reader.read(COMMAND_STRUCT.size)
+            if len(header) < COMMAND_STRUCT.size:
+                break
+            command, p1, p2, length = COMMAND_STRUCT.unpack(header)
+            reader.read(length)
+            self.commands.append((command, p1))
+            result = 0
+            if command == CMD_WVCRE:
+                result = waves
+                waves += 1
+            connection.sendall(b"\0" * (REPLY_STRUCT.size - 4) + result.to_bytes(4, "little", signed=True))
+        connection.close()
+
+    def close(self):
+        self.listener.close()
+
+@pytest.fixture
+def pigpiod():
+    server = FakePigpiod()
+    yield server
+    server.close()
+
+def test_queued_commands_beyond_unread_limit_do_not_hang(pigpiod):
+    backend = PipelinedPigpioBackend("127.0.0.1", pigpiod.port)
+    backend.sock.settimeout(2)  # A reply that never comes fails the test instead of hanging it
+    count = MAX_UNREAD_REPLIES + 6
+    for wid in range(count):
+        assert backend.wave_delete(wid) == 0
+    backend.sync()
+    assert [p1 for command, p1 in pigpiod.commands if command == CMD_WVDEL] == list(range(count))
+    assert backend.deferred_errors == 0
+    backend.stop()
+
+def test_result_of_wave_create_follows_queued_commands(pigpiod):
+    backend = PipelinedPigpioBackend("127.0.0.1", pigpiod.port)
+    backend.sock.settimeout(2)
+    backend.wave_add_new()
+    assert backend.wave_create() == 0
+    backend.wave_delete(0)
+    assert backend.wave_create() == 1
+    backend.stop()